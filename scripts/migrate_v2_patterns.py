@@ -56,14 +56,15 @@ def _load_v2_patterns(source: Path) -> dict[str, dict]:
     return data["merchant_patterns"]
 
 
-def _build_valid_categories(root: Path) -> dict[str, list[str]]:
-    """Return a mapping of valid category names to their subcategory lists.
+def _build_valid_categories(root: Path) -> dict[str, frozenset[str]]:
+    """Return a mapping of valid category names to their subcategory sets.
 
     Loads ``categories.toml`` from *root* (the directory containing the
-    target ``rules.toml``).
+    target ``rules.toml``).  Subcategories are frozensets so the
+    per-pattern membership check is a hash lookup.
     """
     cats = load_categories(root)
-    return {c["name"]: c["subcategories"] for c in cats}
+    return {c["name"]: frozenset(c["subcategories"]) for c in cats}
 
 
 def migrate(
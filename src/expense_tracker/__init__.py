@@ -1,3 +1,5 @@
 """Expense Tracker — CLI tool for multi-account household expense tracking."""
 
-__version__ = "0.1.0"
+from expense_tracker._version import __version__
+
+__all__ = ["__version__"]
@@ -0,0 +1,3 @@
+"""Package version, kept in a dependency-free module so it is cheap to import."""
+
+__version__ = "0.1.0"
@@ -7,47 +7,110 @@ logic is delegated to ``pipeline``, ``categorizer``, ``config``, and
 
 from __future__ import annotations
 
-import logging
-import re
 import sys
 from pathlib import Path
 
 import click
 
-from expense_tracker import __version__
+from expense_tracker._version import __version__
+
+# Matches ``YYYY-MM.csv`` month files (not e.g. ``YYYY-MM-corrected.csv``).
+_MONTH_CSV_GLOB = "[0-9][0-9][0-9][0-9]-[0-9][0-9].csv"
+
+# Written to the output directory after each full push; see ``_push_manifest``.
+_PUSH_MANIFEST = ".push_manifest.json"
+
+# Output CSV columns read back by ``push``; the optional ones are missing
+# from files written before those fields existed.
+_CSV_REQUIRED_COLUMNS = (
+    "transaction_id",
+    "date",
+    "merchant",
+    "description",
+    "amount",
+    "institution",
+    "account",
+    "category",
+    "subcategory",
+    "is_return",
+    "split_from",
+)
+_CSV_OPTIONAL_COLUMNS = ("is_recurring", "source")
+# Boolean cells as written by export ("True"/"False"), plus common hand edits.
+_CSV_TRUE_VALUES = frozenset({"True", "true", "TRUE"})
 
 
 def _validate_month(month: str) -> str:
     """Validate that *month* matches ``YYYY-MM`` and represents a real month.
 
     Returns the validated month string, or raises ``click.BadParameter``.
+    The shape is checked with string methods rather than a regex.
     """
-    if not re.fullmatch(r"\d{4}-\d{2}", month):
+    if not (
+        len(month) == 7
+        and month[4] == "-"
+        and month[:4].isdecimal()
+        and month[5:].isdecimal()
+    ):
         raise click.BadParameter(
             f"Invalid month format: {month!r}. Expected YYYY-MM (e.g. 2026-01)."
         )
-    _, mon = month.split("-")
-    mon_int = int(mon)
-    if mon_int < 1 or mon_int > 12:
+    if not 1 <= int(month[5:]) <= 12:
         raise click.BadParameter(
             f"Invalid month: {month!r}. Month must be between 01 and 12."
         )
     return month
 
 
+class MonthParam(click.ParamType):
+    """Click parameter type for ``YYYY-MM`` months.
+
+    Validation runs while Click parses the command line, so invalid
+    months are reported as usage errors before any command body runs.
+    """
+
+    name = "month"
+
+    def convert(self, value, param, ctx):
+        try:
+            return _validate_month(value)
+        except click.BadParameter as exc:
+            self.fail(exc.message, param, ctx)
+
+
+MONTH = MonthParam()
+
+
+# Root log handler installed by ``_configure_logging``; created on first use.
+_log_handler = None
+
+
 def _configure_logging(verbose: bool, debug: bool) -> None:
-    """Set up logging based on verbosity flags."""
+    """Set up logging based on verbosity flags.
+
+    ``logging`` is imported here rather than at module level so that
+    ``expense --help`` does not load it.  The handler is built once and
+    re-pointed at the current ``sys.stderr`` on later calls.
+    """
+    global _log_handler
+    import logging
+
     if debug:
         level = logging.DEBUG
     elif verbose:
         level = logging.INFO
     else:
         level = logging.WARNING
-    logging.basicConfig(
-        level=level,
-        format="%(levelname)s: %(message)s",
-        force=True,
-    )
+
+    if _log_handler is None:
+        _log_handler = logging.StreamHandler(sys.stderr)
+        _log_handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+    else:
+        _log_handler.setStream(sys.stderr)
+
+    root_logger = logging.getLogger()
+    root_logger.handlers[:] = [_log_handler]
+    root_logger.setLevel(level)
 
 
 @click.group()
@@ -57,7 +120,7 @@ def cli() -> None:
 
 
 @cli.command()
-@click.option("--month", required=True, help="Target month in YYYY-MM format.")
+@click.option("--month", required=True, type=MONTH, help="Target month in YYYY-MM format.")
 @click.option("--no-llm", is_flag=True, default=False, help="Skip LLM categorization.")
 @click.option("--verbose", is_flag=True, default=False, help="Detailed progress output.")
 @click.option("--debug", is_flag=True, default=False, help="Developer-level diagnostics.")
@@ -65,12 +128,6 @@ def process(month: str, no_llm: bool, verbose: bool, debug: bool) -> None:
     """Run the full processing pipeline for a given month."""
     _configure_logging(verbose, debug)
 
-    try:
-        month = _validate_month(month)
-    except click.BadParameter as exc:
-        click.echo(f"Error: {exc.format_message()}", err=True)
-        sys.exit(1)
-
     root = Path.cwd()
 
     # Load configuration
@@ -83,7 +140,10 @@ def process(month: str, no_llm: bool, verbose: bool, debug: bool) -> None:
         )
 
         config = load_config(root)
-        categories = load_categories(root)
+        use_llm = not no_llm and config.llm_provider != "none"
+        # The taxonomy is only sent to the LLM; rule categorization and
+        # the rest of the pipeline never read it.
+        categories = load_categories(root) if use_llm else []
         rules = load_rules(root)
         exclude_patterns = load_exclude_patterns(root)
     except FileNotFoundError as exc:
@@ -98,9 +158,14 @@ def process(month: str, no_llm: bool, verbose: bool, debug: bool) -> None:
 
     # Select LLM adapter
     from expense_tracker.categorizer import categorize
-    from expense_tracker.llm import AnthropicAdapter, ClaudeCodeAdapter, NullAdapter
+    from expense_tracker.llm import (
+        AnthropicAdapter,
+        CachingAdapter,
+        ClaudeCodeAdapter,
+        NullAdapter,
+    )
 
-    if no_llm or config.llm_provider == "none":
+    if not use_llm:
         llm_adapter = NullAdapter()
         if verbose:
             click.echo("LLM categorization disabled.")
@@ -118,6 +183,12 @@ def process(month: str, no_llm: bool, verbose: bool, debug: bool) -> None:
         if verbose:
             click.echo("Using LLM: Claude Code (Max subscription)")
 
+    if not isinstance(llm_adapter, NullAdapter):
+        # Reuse answers from earlier runs; only new merchants hit the LLM.
+        llm_adapter = CachingAdapter(
+            llm_adapter, root / config.enrichment_cache_dir / "llm" / "categories.json"
+        )
+
     # Run the pipeline (stages 1-5: parse, filter, exclude, dedup, transfers, enrich, rule-categorize)
     from expense_tracker.pipeline import run
 
@@ -172,13 +243,19 @@ def process(month: str, no_llm: bool, verbose: bool, debug: bool) -> None:
 
 @cli.command()
 @click.option(
-    "--original", required=True, type=click.Path(exists=True), help="Original output CSV."
+    "--original",
+    required=True,
+    type=click.Path(exists=True, path_type=Path),
+    help="Original output CSV.",
 )
 @click.option(
-    "--corrected", required=True, type=click.Path(exists=True), help="User-corrected CSV."
+    "--corrected",
+    required=True,
+    type=click.Path(exists=True, path_type=Path),
+    help="User-corrected CSV.",
 )
 @click.option("--verbose", is_flag=True, default=False, help="Show details of each learned rule.")
-def learn(original: str, corrected: str, verbose: bool) -> None:
+def learn(original: Path, corrected: Path, verbose: bool) -> None:
     """Compare original and corrected CSVs to learn new categorization rules."""
     _configure_logging(verbose, debug=False)
     root = Path.cwd()
@@ -203,8 +280,8 @@ def learn(original: str, corrected: str, verbose: bool) -> None:
 
     try:
         result = categorizer_learn(
-            original_path=Path(original),
-            corrected_path=Path(corrected),
+            original_path=original,
+            corrected_path=corrected,
             rules=rules,
         )
     except FileNotFoundError as exc:
@@ -246,7 +323,7 @@ def learn(original: str, corrected: str, verbose: bool) -> None:
 
 
 @cli.command()
-@click.option("--month", required=True, help="Target month in YYYY-MM format.")
+@click.option("--month", required=True, type=MONTH, help="Target month in YYYY-MM format.")
 @click.option(
     "--source",
     required=True,
@@ -260,12 +337,6 @@ def enrich(month: str, source: str, headless: bool, verbose: bool, debug: bool)
     """Scrape retailer order history and match to bank transactions."""
     _configure_logging(verbose, debug)
 
-    try:
-        month = _validate_month(month)
-    except click.BadParameter as exc:
-        click.echo(f"Error: {exc.format_message()}", err=True)
-        sys.exit(1)
-
     root = Path.cwd()
 
     # Load configuration
@@ -283,8 +354,6 @@ def enrich(month: str, source: str, headless: bool, verbose: bool, debug: bool)
         click.echo(f"Error loading configuration: {exc}", err=True)
         sys.exit(1)
 
-    cache_dir = root / config.enrichment_cache_dir
-
     # Build transaction list from pipeline parse stage for matching
     from expense_tracker.pipeline import run as pipeline_run
 
@@ -306,174 +375,190 @@ def enrich(month: str, source: str, headless: bool, verbose: bool, debug: bool)
             root=root,
             exclude_patterns=exclude_patterns,
         )
-        # Convert Transaction objects to dicts for the enrichment provider
-        txn_dicts = [
-            {
-                "transaction_id": t.transaction_id,
-                "date": t.date.isoformat(),
-                "amount": str(t.amount),
-                "merchant": t.merchant,
-            }
-            for t in pipeline_result.transactions
-            if not t.is_transfer
-        ]
+        candidates = [t for t in pipeline_result.transactions if not t.is_transfer]
     except Exception as exc:
         click.echo(f"Error loading transactions: {exc}", err=True)
         sys.exit(1)
 
     if verbose:
-        click.echo(f"Found {len(txn_dicts)} non-transfer transactions for {month}")
+        click.echo(f"Found {len(candidates)} non-transfer transactions for {month}")
 
-    source_lower = source.lower()
+    handler = _ENRICH_HANDLERS.get(source.lower())
+    if handler is None:
+        click.echo(f"Error: Unknown source: {source!r}", err=True)
+        sys.exit(1)
+    handler(month, candidates, config, root, headless=headless, verbose=verbose)
 
-    if source_lower == "target":
-        from expense_tracker.enrichment.target import enrich_target
 
-        try:
-            result = enrich_target(
-                month=month,
-                transactions=txn_dicts,
-                cache_dir=cache_dir,
-                headless=headless,
-            )
-        except ImportError as exc:
-            click.echo(f"Error: {exc}", err=True)
-            sys.exit(1)
-        except Exception as exc:
-            click.echo(f"Error during Target enrichment: {exc}", err=True)
-            sys.exit(1)
+def _enrich_target(month, candidates, config, root, *, headless, verbose) -> None:
+    """Run Target enrichment for ``expense enrich --source target``."""
+    from expense_tracker.enrichment.target import enrich_target
 
-    elif source_lower == "amazon":
-        from expense_tracker.enrichment.amazon import AmazonEnrichmentProvider
-        from expense_tracker.models import AmazonAccountConfig
-
-        provider = AmazonEnrichmentProvider()
-
-        # Convert ISO date strings back to date objects and amounts to Decimal
-        # for the matching algorithm.
-        from datetime import date as date_cls
-        from decimal import Decimal as Dec
-
-        normalized_txns = []
-        for txn in txn_dicts:
-            d = txn["date"]
-            if isinstance(d, str):
-                d = date_cls.fromisoformat(d)
-            a = txn["amount"]
-            if isinstance(a, str):
-                a = Dec(a)
-            normalized_txns.append({
-                **txn,
-                "date": d,
-                "amount": a,
-            })
-
-        # Determine Amazon accounts from config.
-        # If no [[enrichment.amazon]] sections exist, fall back to a single
-        # default account for backward compatibility.
-        amazon_accounts = config.amazon_accounts
-        if not amazon_accounts:
-            amazon_accounts = [AmazonAccountConfig(label="default")]
+    try:
+        result = enrich_target(
+            month=month,
+            transactions=_serialize_for_enrichment(candidates),
+            cache_dir=root / config.enrichment_cache_dir,
+            headless=headless,
+        )
+    except ImportError as exc:
+        click.echo(f"Error: {exc}", err=True)
+        sys.exit(1)
+    except Exception as exc:
+        click.echo(f"Error during Target enrichment: {exc}", err=True)
+        sys.exit(1)
 
-        if verbose:
-            labels = [a.label for a in amazon_accounts]
-            click.echo(f"Amazon accounts to scrape: {', '.join(labels)}")
+    lines = [
+        "",
+        "== Target Enrichment Summary ==",
+        f"  Orders scraped:       {result['orders_scraped']}",
+        f"  Orders matched:       {result['orders_matched']}",
+        f"  Cache files written:  {result['cache_files_written']}",
+    ]
+    if result.get("skipped_gift_card", 0) > 0:
+        lines.append(f"  Gift card (skipped):  {result['skipped_gift_card']}")
+    lines.append("")
+    click.echo("\n".join(lines))
+
+
+def _enrich_amazon(month, candidates, config, root, *, headless, verbose) -> None:
+    """Run Amazon enrichment for ``expense enrich --source amazon``."""
+    from expense_tracker.enrichment.amazon import AmazonEnrichmentProvider
+    from expense_tracker.models import AmazonAccountConfig
+
+    provider = AmazonEnrichmentProvider()
+
+    # The matching algorithm works on date objects and Decimals, which
+    # come straight off the transactions.
+    normalized_txns = [
+        {
+            "transaction_id": t.transaction_id,
+            "date": t.date,
+            "amount": t.amount,
+            "merchant": t.merchant,
+        }
+        for t in candidates
+    ]
 
-        try:
-            enrich_result = provider.enrich_multi_account(
-                month=month,
-                root=root,
-                amazon_accounts=amazon_accounts,
-                transactions=normalized_txns,
-            )
-        except ImportError as exc:
-            click.echo(f"Error: {exc}", err=True)
-            sys.exit(1)
-        except Exception as exc:
-            click.echo(f"Error during Amazon enrichment: {exc}", err=True)
-            sys.exit(1)
+    # Determine Amazon accounts from config.
+    # If no [[enrichment.amazon]] sections exist, fall back to a single
+    # default account for backward compatibility.
+    amazon_accounts = config.amazon_accounts
+    if not amazon_accounts:
+        amazon_accounts = [AmazonAccountConfig(label="default")]
 
-        # Print summary
-        click.echo()
-        click.echo("== Amazon Enrichment Summary ==")
-
-        # Show per-account breakdown if there are multiple accounts.
-        if enrich_result.account_stats and len(enrich_result.account_stats) > 1:
-            for stat in enrich_result.account_stats:
-                click.echo(
-                    f'  Account "{stat.label}": '
-                    f"{stat.orders_found} orders found, "
-                    f"{stat.orders_matched} matched"
-                )
-            click.echo(
-                f"  Total: {enrich_result.orders_found} orders, "
-                f"{enrich_result.orders_matched} matched, "
-                f"{enrich_result.orders_unmatched} unmatched"
-            )
-        else:
-            click.echo(f"  Orders found:         {enrich_result.orders_found}")
-            click.echo(f"  Orders matched:       {enrich_result.orders_matched}")
-            click.echo(f"  Orders unmatched:     {enrich_result.orders_unmatched}")
+    if verbose:
+        labels = [a.label for a in amazon_accounts]
+        click.echo(f"Amazon accounts to scrape: {', '.join(labels)}")
 
-        click.echo(f"  Cache files written:  {enrich_result.cache_files_written}")
+    try:
+        enrich_result = provider.enrich_multi_account(
+            month=month,
+            root=root,
+            amazon_accounts=amazon_accounts,
+            transactions=normalized_txns,
+        )
+    except ImportError as exc:
+        click.echo(f"Error: {exc}", err=True)
+        sys.exit(1)
+    except Exception as exc:
+        click.echo(f"Error during Amazon enrichment: {exc}", err=True)
+        sys.exit(1)
 
-        if enrich_result.unmatched_details:
-            click.echo()
-            click.echo("Unmatched orders (review manually):")
-            for detail in enrich_result.unmatched_details:
-                click.echo(f"  - {detail}")
+    # Build the summary and write it in one go
+    lines = ["", "== Amazon Enrichment Summary =="]
 
-        if enrich_result.errors:
-            click.echo()
-            for err in enrich_result.errors:
-                click.echo(f"Error: {err}", err=True)
+    # Show per-account breakdown if there are multiple accounts.
+    if enrich_result.account_stats and len(enrich_result.account_stats) > 1:
+        lines.extend(
+            f'  Account "{stat.label}": '
+            f"{stat.orders_found} orders found, "
+            f"{stat.orders_matched} matched"
+            for stat in enrich_result.account_stats
+        )
+        lines.append(
+            f"  Total: {enrich_result.orders_found} orders, "
+            f"{enrich_result.orders_matched} matched, "
+            f"{enrich_result.orders_unmatched} unmatched"
+        )
+    else:
+        lines.append(f"  Orders found:         {enrich_result.orders_found}")
+        lines.append(f"  Orders matched:       {enrich_result.orders_matched}")
+        lines.append(f"  Orders unmatched:     {enrich_result.orders_unmatched}")
 
-        click.echo()
-        return
+    lines.append(f"  Cache files written:  {enrich_result.cache_files_written}")
 
-    elif source_lower == "venmo":
-        from expense_tracker.enrichment.venmo import enrich_venmo
+    if enrich_result.unmatched_details:
+        lines.append("")
+        lines.append("Unmatched orders (review manually):")
+        lines.extend(f"  - {detail}" for detail in enrich_result.unmatched_details)
 
-        try:
-            result = enrich_venmo(
-                month=month,
-                transactions=txn_dicts,
-                cache_dir=cache_dir,
-                auth_dir=root / ".auth",
-            )
-        except ImportError as exc:
-            click.echo(f"Error: {exc}", err=True)
-            sys.exit(1)
-        except Exception as exc:
-            click.echo(f"Error during Venmo enrichment: {exc}", err=True)
-            sys.exit(1)
+    lines.append("")
+    click.echo("\n".join(lines))
 
-        click.echo()
-        click.echo("== Venmo Enrichment Summary ==")
-        click.echo(f"  Venmo transactions:   {result['venmo_transactions']}")
-        click.echo(f"  Matched to bank:      {result['matched']}")
-        click.echo(f"  Cache files written:  {result['cache_written']}")
-        click.echo()
-        return
+    if enrich_result.errors:
+        click.echo("\n".join(f"Error: {err}" for err in enrich_result.errors), err=True)
 
-    else:
-        click.echo(f"Error: Unknown source: {source!r}", err=True)
+
+def _enrich_venmo(month, candidates, config, root, *, headless, verbose) -> None:
+    """Run Venmo enrichment for ``expense enrich --source venmo``."""
+    from expense_tracker.enrichment.venmo import enrich_venmo
+
+    try:
+        result = enrich_venmo(
+            month=month,
+            transactions=_serialize_for_enrichment(candidates),
+            cache_dir=root / config.enrichment_cache_dir,
+            auth_dir=root / ".auth",
+        )
+    except ImportError as exc:
+        click.echo(f"Error: {exc}", err=True)
+        sys.exit(1)
+    except Exception as exc:
+        click.echo(f"Error during Venmo enrichment: {exc}", err=True)
         sys.exit(1)
 
-    # Print summary (for Target and other dict-returning providers)
-    click.echo()
-    click.echo(f"== {source.title()} Enrichment Summary ==")
-    click.echo(f"  Orders scraped:       {result['orders_scraped']}")
-    click.echo(f"  Orders matched:       {result['orders_matched']}")
-    click.echo(f"  Cache files written:  {result['cache_files_written']}")
-    if result.get("skipped_gift_card", 0) > 0:
-        click.echo(f"  Gift card (skipped):  {result['skipped_gift_card']}")
-    click.echo()
+    click.echo(
+        "\n".join([
+            "",
+            "== Venmo Enrichment Summary ==",
+            f"  Venmo transactions:   {result['venmo_transactions']}",
+            f"  Matched to bank:      {result['matched']}",
+            f"  Cache files written:  {result['cache_written']}",
+            "",
+        ])
+    )
+
+
+# ``expense enrich --source`` value -> handler.  Each handler imports its
+# provider on demand.
+_ENRICH_HANDLERS = {
+    "amazon": _enrich_amazon,
+    "target": _enrich_target,
+    "venmo": _enrich_venmo,
+}
+
+
+def _serialize_for_enrichment(transactions: list) -> list[dict]:
+    """Convert transactions to the string-valued dicts Target and Venmo expect."""
+    return [
+        {
+            "transaction_id": t.transaction_id,
+            "date": t.date.isoformat(),
+            "amount": str(t.amount),
+            "merchant": t.merchant,
+        }
+        for t in transactions
+    ]
 
 
 def _read_csv_transactions(csv_path: Path) -> list:
     """Read a CSV file and return a list of Transaction objects.
 
+    Rows are streamed by :func:`~expense_tracker.export.iter_csv_columns`,
+    so no per-row dict is built.  The optional ``is_recurring`` and
+    ``source`` columns (absent from older output files) read as empty.
+
     Args:
         csv_path: Path to the CSV file.
 
@@ -484,32 +569,37 @@ def _read_csv_transactions(csv_path: Path) -> list:
         KeyError: If a required column is missing.
         Exception: For other CSV parsing errors.
     """
-    import csv as csv_mod
     from datetime import date as date_cls
     from decimal import Decimal
 
+    from expense_tracker.export import iter_csv_columns
     from expense_tracker.models import Transaction
 
+    fromisoformat = date_cls.fromisoformat
     transactions = []
-    with open(csv_path, "r", encoding="utf-8") as f:
-        reader = csv_mod.DictReader(f)
-        for row in reader:
-            txn = Transaction(
-                transaction_id=row["transaction_id"],
-                date=date_cls.fromisoformat(row["date"]),
-                merchant=row["merchant"],
-                description=row["description"],
-                amount=Decimal(row["amount"]),
-                institution=row["institution"],
-                account=row["account"],
-                category=row["category"],
-                subcategory=row["subcategory"],
-                is_return=row["is_return"].lower() == "true",
-                is_recurring=row.get("is_recurring", "false").lower() == "true",
-                split_from=row["split_from"],
-                source=row.get("source", ""),
+    for (
+        txn_id, day, merchant, description, amount, institution, account,
+        category, subcategory, is_return, split_from, is_recurring, source,
+    ) in iter_csv_columns(
+        csv_path, _CSV_OPTIONAL_COLUMNS, required=_CSV_REQUIRED_COLUMNS
+    ):
+        transactions.append(
+            Transaction(
+                transaction_id=txn_id,
+                date=fromisoformat(day),
+                merchant=merchant,
+                description=description,
+                amount=Decimal(amount),
+                institution=institution,
+                account=account,
+                category=category,
+                subcategory=subcategory,
+                is_return=is_return in _CSV_TRUE_VALUES,
+                is_recurring=is_recurring in _CSV_TRUE_VALUES,
+                split_from=split_from,
+                source=source,
             )
-            transactions.append(txn)
+        )
     return transactions
 
 
@@ -525,40 +615,88 @@ def _find_month_csvs(output_dir: Path) -> list[Path]:
     Returns:
         Sorted list of Path objects for matching CSV files.
     """
-    month_csv_pattern = re.compile(r"^\d{4}-\d{2}\.csv$")
-    csvs = [
-        p for p in output_dir.iterdir()
-        if p.is_file() and month_csv_pattern.match(p.name)
-    ]
-    return sorted(csvs)
+    return sorted(p for p in output_dir.glob(_MONTH_CSV_GLOB) if p.is_file())
+
+
+def _push_manifest(csv_files: list[Path], sheets_config) -> dict:
+    """Build the manifest describing what a full push would upload.
+
+    Each month file is identified by its ``(mtime_ns, size)`` so a rewritten
+    file is noticed even when its timestamp is unchanged. The destination
+    sheet is recorded too, so pointing config.toml at another spreadsheet
+    or worksheet always triggers a push.
+
+    Args:
+        csv_files: Month CSV files that would be pushed.
+        sheets_config: The ``SheetsConfig`` being pushed to.
+
+    Returns:
+        A JSON-serializable dict.
+    """
+    files = {}
+    for csv_path in csv_files:
+        st = csv_path.stat()
+        files[csv_path.name] = [st.st_mtime_ns, st.st_size]
+    return {
+        "spreadsheet_id": sheets_config.spreadsheet_id,
+        "worksheet_name": sheets_config.worksheet_name,
+        "files": files,
+    }
+
+
+def _read_push_manifest(manifest_path: Path) -> dict | None:
+    """Load the manifest written by the last full push, or None if unusable."""
+    import json
+
+    try:
+        return json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _write_push_manifest(manifest_path: Path, manifest: dict) -> None:
+    """Atomically write the push manifest next to the month CSVs."""
+    import json
+    import os
+
+    tmp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+    tmp_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    os.replace(tmp_path, manifest_path)
 
 
 @cli.command()
-@click.option("--month", default=None, help="Target month in YYYY-MM format (upserts only that month).")
+@click.option(
+    "--month",
+    default=None,
+    type=MONTH,
+    help="Target month in YYYY-MM format (upserts only that month).",
+)
 @click.option("--all", "push_all", is_flag=True, default=False, help="Clear sheet and push all months.")
+@click.option(
+    "--force",
+    is_flag=True,
+    default=False,
+    help="Push even if no month file changed since the last push.",
+)
 @click.option("--verbose", is_flag=True, default=False, help="Detailed progress output.")
-def push(month: str | None, push_all: bool, verbose: bool) -> None:
+def push(month: str | None, push_all: bool, force: bool, verbose: bool) -> None:
     """Push processed transaction data to Google Sheets.
 
     \b
     With --month: replaces ONLY that month's data (other months untouched).
     With --all: clears the entire sheet and rewrites all months.
-    No flags: same as --all.
+    No flags: same as --all, but does nothing when no month file has
+    changed since the last full push.  Use --force to push anyway, e.g.
+    after the sheet was edited or cleared by hand.
 
     \b
     Examples:
       expense push --month 2026-02      # upsert February only
       expense push --all                # full rewrite
+      expense push --force              # full rewrite, even if unchanged
     """
     _configure_logging(verbose, debug=False)
 
-    if month is not None:
-        try:
-            month = _validate_month(month)
-        except click.BadParameter as exc:
-            click.echo(f"Error: {exc.format_message()}", err=True)
-            sys.exit(1)
-
     if month is not None and push_all:
         click.echo("Error: --month and --all are mutually exclusive.", err=True)
         sys.exit(1)
@@ -621,19 +759,37 @@ def push(month: str | None, push_all: bool, verbose: bool) -> None:
         )
         sys.exit(1)
 
+    # Without flags, skip the rewrite when nothing changed since the last
+    # full push; --all and --force always push.  The manifest only sees
+    # local files, so hand edits to the sheet need --force.
+    manifest_path = output_dir / _PUSH_MANIFEST
+    manifest = None
+    if month is None:
+        manifest = _push_manifest(csv_files, config.sheets)
+        if (
+            not (push_all or force)
+            and _read_push_manifest(manifest_path) == manifest
+        ):
+            click.echo(
+                "Sheet is up to date: no month file changed since the last push.\n"
+                "Use 'expense push --force' to push anyway (e.g. if the sheet "
+                "was edited by hand)."
+            )
+            return
+
     if verbose:
         click.echo(f"Found {len(csv_files)} month file(s):")
         for f in csv_files:
             click.echo(f"  {f.name}")
 
-    # Read and combine transactions from all CSV files
-    transactions = []
+    # Read every CSV up front so a bad file aborts before the sheet is touched
+    per_file = []
     for csv_path in csv_files:
         try:
             file_txns = _read_csv_transactions(csv_path)
             if verbose:
                 click.echo(f"  {csv_path.name}: {len(file_txns)} transactions")
-            transactions.extend(file_txns)
+            per_file.append(file_txns)
         except KeyError as exc:
             click.echo(
                 f"Error: CSV file {csv_path.name} is missing required column: {exc}",
@@ -644,11 +800,20 @@ def push(month: str | None, push_all: bool, verbose: bool) -> None:
             click.echo(f"Error reading {csv_path.name}: {exc}", err=True)
             sys.exit(1)
 
-    # Sort all transactions by date
-    transactions.sort(key=lambda t: (t.date, t.institution, t.amount))
+    # Merge the months into the order export writes them in.  Each file is
+    # already in that order unless hand-edited, so the per-file sort is a
+    # linear check and no combined list is built.
+    import heapq
+
+    from expense_tracker.export import OUTPUT_ORDER
+
+    for file_txns in per_file:
+        file_txns.sort(key=OUTPUT_ORDER)
+    transactions = heapq.merge(*per_file, key=OUTPUT_ORDER)
 
     if verbose:
-        click.echo(f"Total: {len(transactions)} transactions across {len(csv_files)} month(s)")
+        total = sum(map(len, per_file))
+        click.echo(f"Total: {total} transactions across {len(csv_files)} month(s)")
 
     # Push to Google Sheets
     try:
@@ -670,6 +835,12 @@ def push(month: str | None, push_all: bool, verbose: bool) -> None:
         click.echo(f"Error pushing to Google Sheets: {exc}", err=True)
         sys.exit(1)
 
+    if manifest is not None:
+        try:
+            _write_push_manifest(manifest_path, manifest)
+        except OSError as exc:
+            click.echo(f"Warning: could not record push manifest: {exc}", err=True)
+
     # Print summary
     sheet_url = f"https://docs.google.com/spreadsheets/d/{config.sheets.spreadsheet_id}"
     click.echo()
@@ -700,7 +871,7 @@ def init(target_dir: str) -> None:
 
 
 @cli.command()
-@click.option("--month", required=False, help="Target month in YYYY-MM format.")
+@click.option("--month", required=False, type=MONTH, help="Target month in YYYY-MM format.")
 @click.option(
     "--source",
     required=False,
@@ -766,12 +937,6 @@ def download(
         click.echo("Error: --month is required for download (use --auth for auth-only).", err=True)
         sys.exit(1)
 
-    try:
-        month = _validate_month(month)
-    except click.BadParameter as exc:
-        click.echo(f"Error: {exc.format_message()}", err=True)
-        sys.exit(1)
-
     sources = (
         ["chase", "capital-one", "elevations"] if source == "all" else [source.lower()]
     )
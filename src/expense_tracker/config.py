@@ -1,23 +1,21 @@
 """Configuration loading, writing, and project initialization.
 
-Reads TOML config files using stdlib ``tomllib`` and writes them using
-``tomli_w``.  Depends only on ``models.py``.
+Reads TOML config files using stdlib ``tomllib``; the only file written
+back, ``rules.toml``, is serialized by the small formatter below.  Depends
+only on ``models.py``.
 """
 
 from __future__ import annotations
 
-import sys
+import dataclasses
+import functools
+import os
 from pathlib import Path
 
-if sys.version_info >= (3, 11):
+try:
     import tomllib
-else:
-    try:
-        import tomllib
-    except ModuleNotFoundError:
-        import tomli as tomllib  # type: ignore[no-redef]
-
-import tomli_w
+except ModuleNotFoundError:  # Python 3.10
+    import tomli as tomllib  # type: ignore[no-redef]
 
 from expense_tracker.models import (
     AccountConfig,
@@ -168,6 +166,25 @@ patterns = [
 # Same format as user_rules.
 """
 
+# Default files written by ``initialize``, pre-encoded.
+_DEFAULT_FILES = (
+    ("config.toml", _DEFAULT_CONFIG_TOML.encode("utf-8")),
+    ("categories.toml", _DEFAULT_CATEGORIES_TOML.encode("utf-8")),
+    ("rules.toml", _DEFAULT_RULES_TOML.encode("utf-8")),
+)
+
+# ``[[accounts]]`` keys.  Fields without a default must be present; the
+# others keep their ``AccountConfig`` default when omitted, so adding one
+# does not break existing config files.
+_ACCOUNT_REQUIRED_KEYS = tuple(
+    f.name
+    for f in dataclasses.fields(AccountConfig)
+    if f.default is dataclasses.MISSING and f.default_factory is dataclasses.MISSING
+)
+_ACCOUNT_OPTIONAL_KEYS = tuple(
+    f.name for f in dataclasses.fields(AccountConfig) if f.name not in _ACCOUNT_REQUIRED_KEYS
+)
+
 # Directories that ``initialize`` creates.
 _INIT_DIRS = [
     "input/chase",
@@ -201,16 +218,7 @@ def load_config(root: Path) -> AppConfig:
     transfer = data.get("transfer_detection", {})
     llm = data.get("llm", {})
 
-    accounts = [
-        AccountConfig(
-            name=a["name"],
-            institution=a["institution"],
-            parser=a["parser"],
-            account_type=a["account_type"],
-            input_dir=a["input_dir"],
-        )
-        for a in data.get("accounts", [])
-    ]
+    accounts = [_account_config(a) for a in data.get("accounts", ())]
 
     # Parse [[enrichment.amazon]] sections for multi-account support.
     enrichment = data.get("enrichment", {})
@@ -239,8 +247,8 @@ def load_config(root: Path) -> AppConfig:
         accounts=accounts,
         output_dir=general.get("output_dir", "output"),
         enrichment_cache_dir=general.get("enrichment_cache_dir", "enrichment-cache"),
-        transfer_keywords=transfer.get(
-            "keywords", ["PAYMENT", "AUTOPAY", "ONLINE PAYMENT", "PAYOFF"]
+        transfer_keywords=list(
+            transfer.get("keywords", ["PAYMENT", "AUTOPAY", "ONLINE PAYMENT", "PAYOFF"])
         ),
         transfer_date_window=transfer.get("date_window_days", 5),
         llm_provider=llm.get("provider", "anthropic"),
@@ -290,15 +298,15 @@ def load_rules(root: Path) -> list[MerchantRule]:
     data = _read_toml(root / "rules.toml")
     rules: list[MerchantRule] = []
 
-    for pattern, value in data.get("user_rules", {}).items():
-        cat, subcat, recurring = _parse_category_value(value)
-        rules.append(MerchantRule(pattern=pattern, category=cat, subcategory=subcat, recurring=recurring, source="user"))
-
-    for pattern, value in data.get("learned_rules", {}).items():
-        cat, subcat, recurring = _parse_category_value(value)
-        rules.append(
-            MerchantRule(pattern=pattern, category=cat, subcategory=subcat, recurring=recurring, source="learned")
-        )
+    for section, source in (("user_rules", "user"), ("learned_rules", "learned")):
+        for pattern, value in data.get(section, {}).items():
+            cat, subcat, recurring = _parse_category_value(value)
+            rules.append(
+                MerchantRule(
+                    pattern=pattern, category=cat, subcategory=subcat,
+                    recurring=recurring, source=source,
+                )
+            )
 
     return rules
 
@@ -336,26 +344,33 @@ def save_learned_rules(root: Path, rules: list[MerchantRule]) -> None:
     The ``[user_rules]`` section (and everything above it) is preserved
     verbatim.  Only the ``[learned_rules]`` section is rewritten.
 
+    The preserved prefix is copied as raw bytes, without decoding.  The
+    new file is written in one call to a sibling temp file, which then
+    atomically replaces ``rules.toml`` so an interrupted save never leaves
+    a truncated rules file behind.
+
     Args:
         root: Project root directory containing ``rules.toml``.
         rules: The complete list of learned rules to write.  Only rules
             with ``source="learned"`` are written; others are ignored.
     """
     rules_path = root / "rules.toml"
-    original_text = rules_path.read_text(encoding="utf-8")
+    original = rules_path.read_bytes()
 
     # Find where [learned_rules] starts and preserve everything before it.
-    marker = "[learned_rules]"
-    idx = original_text.find(marker)
+    # The prefix is kept as bytes; only the new section is encoded.
+    marker = b"[learned_rules]"
+    idx = original.find(marker)
     if idx == -1:
         # No [learned_rules] section yet -- append one.
-        prefix = original_text.rstrip() + "\n\n"
+        prefix = original.rstrip() + b"\n\n"
     else:
-        prefix = original_text[:idx]
+        prefix = original[:idx]
 
-    # Build the new [learned_rules] section using tomli_w for correct quoting.
-    learned = [r for r in rules if r.source == "learned"]
-    learned_dict = {r.pattern: _format_category_value(r) for r in learned}
+    # Build the new [learned_rules] section.
+    learned_dict = {
+        r.pattern: _format_category_value(r) for r in rules if r.source == "learned"
+    }
 
     section_header = "[learned_rules]\n"
     section_comment = (
@@ -363,18 +378,18 @@ def save_learned_rules(root: Path, rules: list[MerchantRule]) -> None:
         "# Same format as user_rules.\n"
     )
 
-    if learned_dict:
-        # Use tomli_w to serialize just the key-value pairs.  We serialize
-        # the full table then strip its header so we can insert our own
-        # header + comment.
-        kv_text = tomli_w.dumps({"learned_rules": learned_dict})
-        # Remove the "[learned_rules]\n" header that tomli_w generates.
-        kv_lines = kv_text.split("\n", 1)[1] if "\n" in kv_text else ""
-        new_section = section_header + section_comment + kv_lines
-    else:
-        new_section = section_header + section_comment
+    new_section = (
+        section_header
+        + section_comment
+        + "".join(
+            f"{_toml_key(pattern)} = {_toml_value(value)}\n"
+            for pattern, value in learned_dict.items()
+        )
+    )
 
-    rules_path.write_text(prefix + new_section, encoding="utf-8")
+    tmp_path = rules_path.with_name(rules_path.name + ".tmp")
+    tmp_path.write_bytes(prefix + new_section.encode("utf-8"))
+    os.replace(tmp_path, rules_path)
 
 
 def initialize(target_dir: Path) -> None:
@@ -389,14 +404,26 @@ def initialize(target_dir: Path) -> None:
     target_dir = Path(target_dir)
     target_dir.mkdir(parents=True, exist_ok=True)
 
-    # Create subdirectories.
+    # List each parent directory once instead of probing every path; on a
+    # re-run everything is already present and nothing else is touched.
+    listings: dict[str, dict[str, bool]] = {}
+
+    def listing(parent: str) -> dict[str, bool]:
+        if parent not in listings:
+            listings[parent] = _entry_kinds(target_dir / parent)
+        return listings[parent]
+
+    # Create subdirectories.  Anything that is not already a directory goes
+    # to ``mkdir``, which raises if a file is in the way.
     for d in _INIT_DIRS:
-        (target_dir / d).mkdir(parents=True, exist_ok=True)
+        parent, _, name = d.rpartition("/")
+        if not listing(parent).get(name):
+            (target_dir / d).mkdir(parents=True, exist_ok=True)
 
     # Write default config files (skip if they already exist).
-    _write_if_missing(target_dir / "config.toml", _DEFAULT_CONFIG_TOML)
-    _write_if_missing(target_dir / "categories.toml", _DEFAULT_CATEGORIES_TOML)
-    _write_if_missing(target_dir / "rules.toml", _DEFAULT_RULES_TOML)
+    for name, content in _DEFAULT_FILES:
+        if name not in listing(""):
+            _write_new_file(target_dir / name, content)
 
 
 # ---------------------------------------------------------------------------
@@ -405,9 +432,33 @@ def initialize(target_dir: Path) -> None:
 
 
 def _read_toml(path: Path) -> dict:
-    """Read and parse a TOML file."""
-    with open(path, "rb") as f:
-        return tomllib.load(f)
+    """Read and parse a TOML file.
+
+    Parsed documents are cached by path and file identity (inode, size,
+    modification time), so loaders that share a file -- ``load_rules``
+    and ``load_exclude_patterns`` both read ``rules.toml`` -- parse it
+    once until it changes.  The returned dict is shared between callers
+    and must not be mutated.
+    """
+    st = os.stat(path)
+    return _parse_toml(str(path), st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_toml(path: str, inode: int, size: int, mtime_ns: int) -> dict:
+    """Parse *path*; the stat fields only key the cache."""
+    return tomllib.loads(Path(path).read_bytes().decode("utf-8"))
+
+
+def _account_config(entry: dict) -> AccountConfig:
+    """Build an :class:`AccountConfig` from one ``[[accounts]]`` table.
+
+    Raises:
+        KeyError: If a required key is missing.
+    """
+    kwargs = {key: entry[key] for key in _ACCOUNT_REQUIRED_KEYS}
+    kwargs.update((key, entry[key]) for key in _ACCOUNT_OPTIONAL_KEYS if key in entry)
+    return AccountConfig(**kwargs)
 
 
 def _parse_category_value(value: str | dict) -> tuple[str, str, bool]:
@@ -427,10 +478,8 @@ def _parse_category_value(value: str | dict) -> tuple[str, str, bool]:
         return cat, subcat, recurring
 
     # String format: "Category" or "Category:Subcategory"
-    if ":" in value:
-        cat, subcat = value.split(":", 1)
-        return cat.strip(), subcat.strip(), False
-    return value.strip(), "", False
+    cat, _, subcat = value.partition(":")
+    return cat.strip(), subcat.strip(), False
 
 
 def _format_category_value(rule: MerchantRule) -> str | dict:
@@ -451,7 +500,68 @@ def _format_category_value(rule: MerchantRule) -> str | dict:
     return rule.category
 
 
-def _write_if_missing(path: Path, content: str) -> None:
-    """Write *content* to *path* only if the file does not already exist."""
-    if not path.exists():
-        path.write_text(content, encoding="utf-8")
+# Characters allowed in a TOML bare key; anything else is quoted.
+_BARE_KEY_CHARS = frozenset(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_-"
+)
+
+# Escapes for a TOML basic string: quote, backslash and control characters.
+_TOML_STRING_ESCAPES = {
+    **{c: f"\\u{c:04X}" for c in (*range(0x20), 0x7F)},
+    ord("\b"): "\\b",
+    ord("\t"): "\\t",
+    ord("\n"): "\\n",
+    ord("\f"): "\\f",
+    ord("\r"): "\\r",
+    ord('"'): '\\"',
+    ord("\\"): "\\\\",
+}
+
+
+def _toml_string(value: str) -> str:
+    """Render *value* as a TOML basic string."""
+    return '"' + value.translate(_TOML_STRING_ESCAPES) + '"'
+
+
+def _toml_key(key: str) -> str:
+    """Render *key* bare when TOML allows it, quoted otherwise."""
+    if key and _BARE_KEY_CHARS.issuperset(key):
+        return key
+    return _toml_string(key)
+
+
+def _toml_value(value: str | bool | dict) -> str:
+    """Render a learned-rule value: a string, or an inline table of them."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, dict):
+        fields = ", ".join(f"{_toml_key(k)} = {_toml_value(v)}" for k, v in value.items())
+        return "{ " + fields + " }"
+    return _toml_string(value)
+
+
+def _write_new_file(path: Path, content: bytes) -> None:
+    """Create *path* with *content*, leaving an existing file untouched.
+
+    ``O_EXCL`` makes the existence check and the create one atomic step.
+    The mode is left to the umask, as with ``open()``.
+    """
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    except FileExistsError:
+        return
+    # A buffered file object writes everything, unlike a bare ``os.write``.
+    with os.fdopen(fd, "wb") as f:
+        f.write(content)
+
+
+def _entry_kinds(directory: Path) -> dict[str, bool]:
+    """Map each name in *directory* to whether it is a directory.
+
+    Returns an empty dict if *directory* is missing.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name: entry.is_dir() for entry in entries}
+    except FileNotFoundError:
+        return {}
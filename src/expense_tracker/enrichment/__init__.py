@@ -107,6 +107,13 @@ class EnrichmentProvider(Protocol):
 
 _PROVIDERS: dict[str, type] = {}
 
+# Built-in providers as name -> (module, class).  They are imported the first
+# time they are looked up, so importing this package (which every
+# ``expense_tracker.enrichment.*`` import does) stays cheap.
+_BUILTIN_PROVIDERS: dict[str, tuple[str, str]] = {
+    "amazon": ("expense_tracker.enrichment.amazon", "AmazonEnrichmentProvider"),
+}
+
 
 def register_provider(name: str, cls: type) -> None:
     """Register an enrichment provider class under *name*."""
@@ -120,18 +127,13 @@ def get_provider(name: str) -> type:
         KeyError: If no provider is registered under *name*.
     """
     if name not in _PROVIDERS:
-        available = ", ".join(sorted(_PROVIDERS)) or "(none)"
-        raise KeyError(
-            f"Unknown enrichment provider {name!r}. Available: {available}"
-        )
+        if name not in _BUILTIN_PROVIDERS:
+            available = ", ".join(sorted(_PROVIDERS.keys() | _BUILTIN_PROVIDERS.keys()))
+            raise KeyError(
+                f"Unknown enrichment provider {name!r}. Available: {available or '(none)'}"
+            )
+        import importlib
+
+        module_name, class_name = _BUILTIN_PROVIDERS[name]
+        register_provider(name, getattr(importlib.import_module(module_name), class_name))
     return _PROVIDERS[name]
-
-
-# Register built-in providers on import.
-def _register_builtins() -> None:
-    from expense_tracker.enrichment.amazon import AmazonEnrichmentProvider
-
-    register_provider("amazon", AmazonEnrichmentProvider)
-
-
-_register_builtins()
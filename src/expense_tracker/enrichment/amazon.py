@@ -20,8 +20,11 @@ Design decisions:
 
 from __future__ import annotations
 
+import calendar
 import logging
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date, timedelta
 from decimal import Decimal
@@ -53,6 +56,120 @@ ORDER_HISTORY_URL = "https://www.amazon.com/your-orders/orders?timeFilter=year-{
 # Directory under the project root where browser auth state is stored.
 AUTH_STATE_DIR = ".auth/amazon"
 
+# Held while a browser window is open for the user to log in, so accounts
+# scraped concurrently ask for their logins one at a time.
+_LOGIN_LOCK = threading.Lock()
+
+# Patterns used to parse scraped order text, compiled once.
+_PRICE_STRIP_RE = re.compile(r"[^\d.]")
+_DATE_RE = re.compile(r"(\w+)\s+(\d{1,2}),?\s+(\d{4})")
+_ORDER_PLACED_RE = re.compile(
+    r"(?:Order\s*placed|Ordered\s*on)[:\s]*"
+    r"(\w+\s+\d{1,2},?\s+\d{4})",
+    re.IGNORECASE,
+)
+_ANY_DATE_RE = re.compile(
+    r"((?:January|February|March|April|May|June|July|August|"
+    r"September|October|November|December)\s+\d{1,2},?\s+\d{4})"
+)
+_TOTAL_RE = re.compile(r"Total[:\s]*\$?([\d,]+\.\d{2})", re.IGNORECASE)
+_DOLLAR_AMOUNT_RE = re.compile(r"\$[\d,]+\.\d{2}")
+_HREF_ORDER_ID_RE = re.compile(r"orderID=([^&]+)")
+_ORDER_ID_RE = re.compile(r"\d{3}-\d{7}-\d{7}")
+
+# Lowercased full and abbreviated month names -> month number.
+_MONTH_NUMBERS = {
+    name.lower(): num
+    for names in (calendar.month_name, calendar.month_abbr)
+    for num, name in enumerate(names)
+    if num
+}
+
+# Any of these on the page means the order history has loaded.  Amazon
+# uses several different CSS class patterns depending on the layout
+# served; they are listed from newest to oldest.
+_ORDER_HISTORY_SELECTOR = (
+    "div.order-card, div.order, "
+    ".js-order-card, "
+    "[data-component='orderCard'], "
+    "#ordersContainer, "
+    ".your-orders-content-container"
+)
+
+# CSS selectors for the parts of an order card, passed to
+# ``_EXTRACT_ORDER_CARDS_JS``.  Each ``querySelector`` returns the first
+# DOM-order match across ALL comma-separated selectors (no priority),
+# which the notes below guard against.
+#
+# The ``div.order-card`` and ``div.order`` card selectors are the primary
+# ones used in Amazon's current (2025) layout.  Older selectors like
+# ``.js-order-card`` are kept as fallbacks since Amazon may serve
+# different HTML to different users.
+_ORDER_CARD_SELECTOR = (
+    "div.order-card, div.order, "
+    ".js-order-card, "
+    "[data-component='orderCard']"
+)
+_ORDER_ID_SELECTOR = (
+    ".yohtmlc-order-id span[dir='ltr'], "
+    ".yohtmlc-order-id bdi[dir='ltr'], "
+    "[data-component='orderId'], "
+    ".yohtmlc-order-id .value"
+)
+# Amazon's 2025 layout uses ``div.item-box`` for each line item.
+# Do NOT include ``.a-fixed-left-grid-inner`` here -- it is a child of
+# ``.item-box`` and would cause duplicate matches.
+_LINE_ITEM_SELECTOR = (
+    ".item-box, "
+    "div.yohtmlc-item, "
+    "[data-component='purchasedItems'] .a-fixed-left-grid, "
+    "[data-testid='order-item']"
+)
+# Product title, within a line item or (as a fallback) the whole card.
+# Do NOT use a bare ``.a-link-normal[href*='/dp/']``: each ``.item-box``
+# has one such link wrapping the product *image* (``tabindex="-1"``,
+# empty text) before the title link, which would make the item be
+# skipped.  Likewise no ``.a-link-normal[href*='/gp/']``: the order
+# header's "View invoice" link matches it and comes first.
+_ITEM_NAME_SELECTOR = (
+    ".yohtmlc-product-title, "
+    "[data-component='itemTitle'], "
+    ".yohtmlc-item a, "
+    ".yohtmlc-product-title .a-link-normal[href*='/dp/'], "
+    ".a-link-normal[href*='/dp/']:not([tabindex='-1']), "
+    "[data-testid='item-title']"
+)
+# Amazon's 2025 order history page does NOT display individual item
+# prices; these are kept in case Amazon adds per-item pricing later.
+_ITEM_PRICE_SELECTOR = (
+    ".a-color-price, "
+    ".yohtmlc-item-price, "
+    "[data-component='unitPrice'] .a-text-price :not(.a-offscreen), "
+    ".yohtmlc-item .a-color-price, "
+    "[data-testid='item-price']"
+)
+
+# Collects the text the parser needs from every order card on the page in
+# one browser round-trip.  Missing elements come back as ``null``.
+_EXTRACT_ORDER_CARDS_JS = """
+([cardSel, idSel, itemSel, nameSel, priceSel]) => {
+  const text = (el) => (el ? el.innerText : null);
+  return Array.from(document.querySelectorAll(cardSel), (card) => {
+    const link = card.querySelector("a[href*='orderID=']");
+    return {
+      text: card.innerText,
+      orderId: text(card.querySelector(idSel)),
+      href: link ? link.getAttribute("href") : null,
+      items: Array.from(card.querySelectorAll(itemSel), (item) => ({
+        name: text(item.querySelector(nameSel)),
+        price: text(item.querySelector(priceSel)),
+      })),
+      title: text(card.querySelector(nameSel)),
+    };
+  });
+}
+"""
+
 
 @dataclass
 class AmazonLineItem:
@@ -103,7 +220,8 @@ def match_orders_to_transactions(
     Uses conservative matching: an order matches a transaction only when:
     1. The order date is within ``DATE_PROXIMITY_DAYS`` of the transaction date.
     2. The order total matches the absolute transaction amount within
-       ``AMOUNT_TOLERANCE`` (to handle tax rounding).
+       ``AMOUNT_TOLERANCE`` (to handle tax rounding).  Amounts are compared
+       in whole cents.
     3. The match is unambiguous -- if multiple transactions could match the
        same order, the order is left unmatched.
 
@@ -121,25 +239,37 @@ def match_orders_to_transactions(
     # unambiguous in BOTH directions (one order -> one transaction AND
     # one transaction -> one order).
 
-    # Step 1: compute all potential (order, transaction) pairs.
-    order_candidates: dict[str, list[dict]] = {}
-    txn_candidates: dict[str, list[AmazonOrder]] = {}
+    # Step 1: compute all potential (order, transaction) pairs.  Transactions
+    # are bucketed by day (with their absolute amount converted to integer
+    # cents once), so each order only looks at the days inside its date
+    # window rather than at every transaction, and compares plain ints.
+    tolerance = _to_cents(AMOUNT_TOLERANCE)
+    txn_by_id: dict[str, dict] = {}
+    txns_by_day: dict[int, list[tuple[str, int]]] = {}
+    for txn in transactions:
+        txn_id = txn["transaction_id"]
+        txn_by_id[txn_id] = txn
+        txns_by_day.setdefault(txn["date"].toordinal(), []).append(
+            (txn_id, _to_cents(abs(txn["amount"])))
+        )
 
-    for order in orders:
-        order_candidates.setdefault(order.order_id, [])
-        for txn in transactions:
-            # Date proximity check.
-            day_diff = abs((order.order_date - txn["date"]).days)
-            if day_diff > DATE_PROXIMITY_DAYS:
-                continue
+    # Candidates are kept as IDs: order ID -> transaction IDs, and
+    # transaction ID -> order IDs.
+    order_candidates: dict[str, list[str]] = {}
+    txn_candidates: dict[str, list[str]] = {}
 
-            # Amount check: order total should match absolute transaction amount.
-            txn_abs = abs(txn["amount"])
-            if abs(order.order_total - txn_abs) > AMOUNT_TOLERANCE:
-                continue
+    for order in orders:
+        candidates = order_candidates.setdefault(order.order_id, [])
+        order_cents = _to_cents(order.order_total)
+        order_day = order.order_date.toordinal()
+        for day in range(order_day - DATE_PROXIMITY_DAYS, order_day + DATE_PROXIMITY_DAYS + 1):
+            for txn_id, txn_cents in txns_by_day.get(day, ()):
+                # Amount check: order total should match absolute transaction amount.
+                if abs(order_cents - txn_cents) > tolerance:
+                    continue
 
-            order_candidates[order.order_id].append(txn)
-            txn_candidates.setdefault(txn["transaction_id"], []).append(order)
+                candidates.append(txn_id)
+                txn_candidates.setdefault(txn_id, []).append(order.order_id)
 
     # Step 2: accept only unambiguous matches (1-to-1 in both directions).
     matches: list[tuple[AmazonOrder, dict]] = []
@@ -150,39 +280,38 @@ def match_orders_to_transactions(
         if order.order_id in matched_order_ids:
             continue
 
+        # The single not-yet-matched candidate transaction, if exactly one.
         candidates = order_candidates.get(order.order_id, [])
-
-        # Filter out already-matched transactions.
-        available = [t for t in candidates if t["transaction_id"] not in matched_txn_ids]
-
-        if len(available) != 1:
-            if len(available) > 1:
+        txn_id = _sole_available(candidates, matched_txn_ids)
+        if txn_id is None:
+            available = sum(tid not in matched_txn_ids for tid in candidates)
+            if available > 1:
                 logger.warning(
                     "Ambiguous match for order %s ($%s on %s): "
                     "%d candidate transactions",
                     order.order_id,
                     order.order_total,
                     order.order_date,
-                    len(available),
+                    available,
                 )
             continue
 
-        matched_txn = available[0]
+        matched_txn = txn_by_id[txn_id]
 
         # Check the reverse: is this transaction also unambiguous?
-        reverse_candidates = txn_candidates.get(matched_txn["transaction_id"], [])
-        reverse_available = [
-            o for o in reverse_candidates if o.order_id not in matched_order_ids
-        ]
-        if len(reverse_available) != 1:
-            if len(reverse_available) > 1:
+        reverse_candidates = txn_candidates.get(txn_id, [])
+        if _sole_available(reverse_candidates, matched_order_ids) is None:
+            reverse_available = sum(
+                oid not in matched_order_ids for oid in reverse_candidates
+            )
+            if reverse_available > 1:
                 logger.warning(
                     "Ambiguous match for transaction %s ($%s on %s): "
                     "%d candidate orders",
-                    matched_txn["transaction_id"],
+                    txn_id,
                     matched_txn["amount"],
                     matched_txn["date"],
-                    len(reverse_available),
+                    reverse_available,
                 )
             continue
 
@@ -193,6 +322,22 @@ def match_orders_to_transactions(
     return matches
 
 
+def _sole_available(ids: list[str], taken: set[str]) -> str | None:
+    """Return the only ID in *ids* not in *taken*, or ``None``.
+
+    ``None`` means there were none or several; the scan stops at the
+    second available ID.
+    """
+    found = None
+    for candidate in ids:
+        if candidate in taken:
+            continue
+        if found is not None:
+            return None
+        found = candidate
+    return found
+
+
 # ---------------------------------------------------------------------------
 # Cache file generation
 # ---------------------------------------------------------------------------
@@ -265,9 +410,14 @@ def _parse_month_range(month: str) -> tuple[date, date]:
     return first_day, last_day
 
 
+def _to_cents(amount: Decimal) -> int:
+    """Convert a dollar amount to integer cents (rounding half to even)."""
+    return int((amount * 100).to_integral_value())
+
+
 def _parse_price(text: str) -> Decimal:
     """Parse a price string like ``"$30.00"`` or ``"30.00"`` into a Decimal."""
-    cleaned = re.sub(r"[^\d.]", "", text)
+    cleaned = _PRICE_STRIP_RE.sub("", text)
     if not cleaned:
         return Decimal("0")
     return Decimal(cleaned)
@@ -278,20 +428,13 @@ def _parse_date(text: str) -> date | None:
 
     Returns ``None`` if the string cannot be parsed.
     """
-    import calendar
-
-    # Pattern: "Month Day, Year"
-    match = re.match(r"(\w+)\s+(\d{1,2}),?\s+(\d{4})", text.strip())
+    # Pattern: "Month Day, Year" (full or abbreviated month name)
+    match = _DATE_RE.match(text.strip())
     if not match:
         return None
 
     month_name, day_str, year_str = match.groups()
-    month_names = {name.lower(): num for num, name in enumerate(calendar.month_name) if num}
-    mon_num = month_names.get(month_name.lower())
-    if mon_num is None:
-        # Try abbreviated month names.
-        month_abbr = {name.lower(): num for num, name in enumerate(calendar.month_abbr) if num}
-        mon_num = month_abbr.get(month_name.lower())
+    mon_num = _MONTH_NUMBERS.get(month_name.lower())
     if mon_num is None:
         return None
 
@@ -304,9 +447,10 @@ def _parse_date(text: str) -> date | None:
 class AmazonEnrichmentProvider:
     """Enrichment provider that scrapes Amazon order history.
 
-    Uses Playwright in headful mode to allow the user to handle 2FA/CAPTCHA
-    during login.  Browser state (cookies, session) is persisted under
-    ``.auth/amazon/`` (single account) or ``.auth/amazon-{label}/``
+    Uses Playwright headless while a saved session still reaches the order
+    history, and in headful mode whenever the user must handle
+    login/2FA/CAPTCHA.  Browser state (cookies, session) is persisted
+    under ``.auth/amazon/`` (single account) or ``.auth/amazon-{label}/``
     (multi-account) in the project directory.
 
     Usage::
@@ -376,9 +520,9 @@ class AmazonEnrichmentProvider:
     ) -> "EnrichmentResult":
         """Run Amazon enrichment across multiple accounts for *month*.
 
-        Scrapes each configured Amazon account sequentially, merges all
-        orders into a single list, then runs the matching algorithm
-        against the combined transaction list.
+        Scrapes the configured Amazon accounts concurrently (one browser
+        per account), merges all orders into a single list, then runs the
+        matching algorithm against the combined transaction list.
 
         Args:
             month: Target month as ``"YYYY-MM"`` string.
@@ -403,22 +547,32 @@ class AmazonEnrichmentProvider:
         if transactions is None:
             transactions = self._load_transactions(month, root)
 
-        # Scrape orders from each Amazon account sequentially.
+        def scrape(acct) -> list[AmazonOrder]:
+            auth_dir = self._auth_dir_for_account(root, acct.label)
+            auth_dir.mkdir(parents=True, exist_ok=True)
+            logger.info("Scraping Amazon orders (%s)...", acct.label)
+            return self._scrape_orders(
+                first_day, last_day, auth_dir, cache_dir=cache_dir, label=acct.label,
+            )
+
+        # Scrape the accounts concurrently: each has its own browser
+        # profile, and the work is waiting on Amazon.  Playwright's sync
+        # API runs one instance per thread.  Interactive logins are still
+        # taken one at a time (see ``_LOGIN_LOCK``).  A single account is
+        # scraped on the calling thread.
+        pending = []
+        if len(amazon_accounts) > 1:
+            with ThreadPoolExecutor(max_workers=len(amazon_accounts)) as pool:
+                pending = [pool.submit(scrape, acct) for acct in amazon_accounts]
+
         all_orders: list[AmazonOrder] = []
         account_stats: list[AccountEnrichmentStats] = []
         errors: list[str] = []
 
-        for acct in amazon_accounts:
+        for i, acct in enumerate(amazon_accounts):
             label = acct.label
-            auth_dir = self._auth_dir_for_account(root, label)
-            auth_dir.mkdir(parents=True, exist_ok=True)
-
-            logger.info("Scraping Amazon orders (%s)...", label)
-
             try:
-                orders = self._scrape_orders(
-                    first_day, last_day, auth_dir, cache_dir=cache_dir,
-                )
+                orders = pending[i].result() if pending else scrape(acct)
                 # Tag each order with the account label.
                 for order in orders:
                     order.account_label = label
@@ -530,12 +684,13 @@ class AmazonEnrichmentProvider:
         last_day: date,
         auth_dir: Path,
         cache_dir: Path | None = None,
+        label: str = "default",
     ) -> list[AmazonOrder]:
         """Scrape Amazon order history using Playwright.
 
-        Opens a headful browser, loads saved session state if available,
-        navigates to order history, and scrapes orders within the date range.
-        Handles pagination.
+        Opens the account's persistent browser profile, navigates to order
+        history, and scrapes orders within the date range.  Handles
+        pagination.
 
         Args:
             first_day: First day of the target month.
@@ -543,6 +698,7 @@ class AmazonEnrichmentProvider:
             auth_dir: Directory for storing/loading browser auth state.
             cache_dir: Optional cache directory for saving debug HTML dumps
                 when selectors fail to match.
+            label: Account label, shown in login prompts.
 
         Returns:
             List of :class:`AmazonOrder` objects within the date range.
@@ -555,49 +711,94 @@ class AmazonEnrichmentProvider:
         profile_dir = auth_dir / "browser-profile"
         profile_dir.mkdir(parents=True, exist_ok=True)
 
-        orders: list[AmazonOrder] = []
+        # Navigate to order history for the target year.
+        url = ORDER_HISTORY_URL.format(year=first_day.year)
 
         with sync_playwright() as p:
+            context, page = self._open_order_history(p, profile_dir, url, label)
+            try:
+                # Scrape orders across all pages.
+                return self._scrape_all_pages(
+                    page, first_day, last_day, cache_dir=cache_dir,
+                )
+            finally:
+                context.close()
+
+    def _open_order_history(self, p, profile_dir: Path, url: str, label: str) -> tuple:
+        """Open *profile_dir* on the order history page, signed in.
+
+        A profile left by an earlier run is opened headless, and kept only
+        if it actually shows the order history.  Otherwise (login, 2FA,
+        CAPTCHA, or a profile from an abandoned first login) the browser is
+        relaunched with a window; that part holds ``_LOGIN_LOCK``.
+
+        Returns:
+            A ``(context, page)`` tuple.  The caller closes the context.
+        """
+
+        def launch(headless: bool):
             context = p.chromium.launch_persistent_context(
                 user_data_dir=str(profile_dir),
-                headless=False,
+                headless=headless,
                 viewport={"width": 1280, "height": 900},
                 args=["--disable-blink-features=AutomationControlled", "--no-sandbox"],
             )
-
             page = context.pages[0] if context.pages else context.new_page()
+            return context, page
 
+        # A profile from an earlier run usually still holds a signed-in
+        # session, so skip the window unless login turns out to be needed.
+        if any(profile_dir.iterdir()):
+            context, page = launch(headless=True)
             try:
-                # Navigate to order history for the target year.
-                year = first_day.year
-                page.goto(ORDER_HISTORY_URL.format(year=year), wait_until="domcontentloaded")
+                page.goto(url, wait_until="domcontentloaded")
+                if self._shows_order_history(page):
+                    return context, page
+            except BaseException:
+                context.close()
+                raise
+            context.close()
+            logger.info(
+                "Saved Amazon session (%s) did not reach order history; "
+                "opening a browser window.",
+                label,
+            )
+
+        with _LOGIN_LOCK:
+            context, page = launch(headless=False)
+            try:
+                page.goto(url, wait_until="domcontentloaded")
 
                 # Log in if needed (may require multiple rounds for 2FA).
                 for _attempt in range(3):
                     if self._needs_login(page):
                         logger.info(
-                            "Amazon login required. Please log in using the browser window."
+                            "Amazon login required (%s). "
+                            "Please log in using the browser window.",
+                            label,
                         )
                         self._wait_for_login(page)
                         logger.info("Login successful — session persisted via browser profile.")
 
                         # Navigate to order history after login.
-                        page.goto(
-                            ORDER_HISTORY_URL.format(year=year),
-                            wait_until="domcontentloaded",
-                        )
+                        page.goto(url, wait_until="domcontentloaded")
                     else:
                         break
-
-                # Scrape orders across all pages.
-                orders = self._scrape_all_pages(
-                    page, first_day, last_day, cache_dir=cache_dir,
-                )
-
-            finally:
+            except BaseException:
                 context.close()
+                raise
 
-        return orders
+        return context, page
+
+    def _shows_order_history(self, page: Page) -> bool:  # noqa: F821
+        """Check if *page* is the signed-in order history, not a challenge."""
+        if self._needs_login(page):
+            return False
+        try:
+            page.wait_for_selector(_ORDER_HISTORY_SELECTOR, timeout=15_000)
+        except Exception:
+            return False
+        return True
 
     def _needs_login(self, page: "Page") -> bool:  # noqa: F821
         """Check if the current page is an Amazon auth/challenge page."""
@@ -639,7 +840,9 @@ class AmazonEnrichmentProvider:
         """Scrape orders from all pages of Amazon order history.
 
         Follows pagination links until no more pages are available or
-        all orders within the date range have been found.
+        all orders within the date range have been found.  Order history
+        is listed newest first, so once a page shows an order placed
+        before *first_day* the remaining pages are not loaded.
 
         Args:
             page: Playwright page positioned on the order history.
@@ -658,18 +861,9 @@ class AmazonEnrichmentProvider:
             page_num += 1
             logger.info("Scraping order history page %d", page_num)
 
-            # Wait for order cards to load.  Amazon uses several different
-            # CSS class patterns depending on the layout served; try them
-            # from newest to oldest.
+            # Wait for order cards to load.
             try:
-                page.wait_for_selector(
-                    "div.order-card, div.order, "
-                    ".js-order-card, "
-                    "[data-component='orderCard'], "
-                    "#ordersContainer, "
-                    ".your-orders-content-container",
-                    timeout=30_000,
-                )
+                page.wait_for_selector(_ORDER_HISTORY_SELECTOR, timeout=30_000)
             except Exception:
                 # Dump current page HTML to a debug file so we can inspect
                 # Amazon's actual DOM on future failures.
@@ -691,7 +885,9 @@ class AmazonEnrichmentProvider:
                         )
                 raise
 
-            page_orders = self._scrape_page_orders(page, first_day, last_day)
+            page_orders, past_range = self._scrape_page_orders(
+                page, first_day, last_day,
+            )
             all_orders.extend(page_orders)
 
             # If first page found no orders, dump HTML for debugging.
@@ -708,6 +904,9 @@ class AmazonEnrichmentProvider:
                 except Exception as dump_exc:
                     logger.warning("Failed to save debug HTML: %s", dump_exc)
 
+            if past_range:
+                break
+
             # Check for next page.  Amazon's pagination uses <ul class="a-pagination">
             # with the last <li> containing the "next" link.
             next_button = page.query_selector(
@@ -735,116 +934,106 @@ class AmazonEnrichmentProvider:
         page: "Page",  # noqa: F821
         first_day: date,
         last_day: date,
-    ) -> list[AmazonOrder]:
+    ) -> tuple[list[AmazonOrder], bool]:
         """Scrape orders from the current page of order history.
 
+        Everything the parser needs from the page's order cards is pulled
+        out in a single ``page.evaluate`` call, rather than one browser
+        round-trip per card and per line item.
+
         Args:
             page: Playwright page with order cards loaded.
             first_day: Start of the target date range.
             last_day: End of the target date range.
 
         Returns:
-            List of :class:`AmazonOrder` objects within the date range
-            found on this page.
+            A ``(orders, past_range)`` tuple: the :class:`AmazonOrder`
+            objects within the date range found on this page, and whether
+            the page contains an order placed before *first_day*.
         """
         orders: list[AmazonOrder] = []
-
-        # Amazon order cards have various CSS class patterns.  The
-        # ``div.order-card`` and ``div.order`` selectors are the primary
-        # ones used in Amazon's current (2025) layout.  Older selectors
-        # like ``.js-order-card`` are kept as fallbacks since Amazon may
-        # serve different HTML to different users.
-        order_cards = page.query_selector_all(
-            "div.order-card, div.order, "
-            ".js-order-card, "
-            "[data-component='orderCard']"
+        past_range = False
+
+        cards = page.evaluate(
+            _EXTRACT_ORDER_CARDS_JS,
+            [
+                _ORDER_CARD_SELECTOR,
+                _ORDER_ID_SELECTOR,
+                _LINE_ITEM_SELECTOR,
+                _ITEM_NAME_SELECTOR,
+                _ITEM_PRICE_SELECTOR,
+            ],
         )
 
-        for card in order_cards:
+        for card in cards:
             try:
                 order = self._parse_order_card(card)
                 if order is None:
                     continue
 
                 # Filter to target month range.
-                if first_day <= order.order_date <= last_day:
+                if order.order_date < first_day:
+                    past_range = True
+                elif order.order_date <= last_day:
                     orders.append(order)
 
             except Exception as exc:
                 logger.warning("Failed to parse order card: %s", exc)
 
-        return orders
+        return orders, past_range
 
-    def _parse_order_card(self, card) -> AmazonOrder | None:
-        """Parse a single order card element into an :class:`AmazonOrder`.
+    def _parse_order_card(self, card: dict) -> AmazonOrder | None:
+        """Parse one extracted order card into an :class:`AmazonOrder`.
 
         Returns ``None`` if essential fields cannot be extracted.
 
         Strategy: Amazon's order card HTML uses generic CSS classes
         (e.g. ``a-color-secondary``) for both labels and values, making
-        CSS-only selection unreliable.  We extract the card's full text
-        and use regex to pull out the date, total, and order ID.  CSS
-        selectors are used as targeted fallbacks.
+        CSS-only selection unreliable.  We take the card's full text
+        and use regex to pull out the date, total, and order ID.  Values
+        found via CSS selectors are used as targeted fallbacks.
+
+        Args:
+            card: One entry produced by ``_EXTRACT_ORDER_CARDS_JS``.
         """
-        card_text = card.inner_text()
+        card_text = card["text"]
 
         # --- Extract order date via regex on card text ---
         order_date = None
-        date_match = re.search(
-            r"(?:Order\s*placed|Ordered\s*on)[:\s]*"
-            r"(\w+\s+\d{1,2},?\s+\d{4})",
-            card_text, re.IGNORECASE,
-        )
+        date_match = _ORDER_PLACED_RE.search(card_text)
         if date_match:
             order_date = _parse_date(date_match.group(1))
         if order_date is None:
             # Broader fallback: any "Month Day, Year" in the card text.
-            date_match = re.search(
-                r"((?:January|February|March|April|May|June|July|August|"
-                r"September|October|November|December)\s+\d{1,2},?\s+\d{4})",
-                card_text,
-            )
+            date_match = _ANY_DATE_RE.search(card_text)
             if date_match:
                 order_date = _parse_date(date_match.group(1))
         if order_date is None:
             return None
 
         # --- Extract order total via regex on card text ---
-        total_match = re.search(
-            r"Total[:\s]*\$?([\d,]+\.\d{2})", card_text, re.IGNORECASE,
-        )
+        total_match = _TOTAL_RE.search(card_text)
         if total_match:
             order_total = _parse_price(total_match.group(0))
         else:
             # Broader fallback: first dollar amount in the card.
-            price_match = re.search(r"\$[\d,]+\.\d{2}", card_text)
+            price_match = _DOLLAR_AMOUNT_RE.search(card_text)
             order_total = _parse_price(price_match.group(0)) if price_match else Decimal("0")
         if order_total == 0:
             return None
 
         # --- Extract order ID ---
-        order_id = ""
-        # Try CSS selector first (reliable when present).
-        order_id_el = card.query_selector(
-            ".yohtmlc-order-id span[dir='ltr'], "
-            ".yohtmlc-order-id bdi[dir='ltr'], "
-            "[data-component='orderId'], "
-            ".yohtmlc-order-id .value"
-        )
-        if order_id_el:
-            order_id = order_id_el.inner_text().strip()
-        if not order_id:
+        # Try the order-ID element first (reliable when present).
+        order_id = (card["orderId"] or "").strip()
+        if not order_id and card["href"]:
             # Try link href.
-            order_link = card.query_selector("a[href*='orderID=']")
-            if order_link:
-                href = order_link.get_attribute("href") or ""
-                id_match = re.search(r"orderID=([^&]+)", href)
-                if id_match:
-                    order_id = id_match.group(1)
+            id_match = _HREF_ORDER_ID_RE.search(card["href"])
+            if id_match:
+                order_id = id_match.group(1)
         if not order_id:
             # Regex fallback on card text: Amazon order IDs are
             # 3-7-7 digit patterns like 113-4763190-6893819.
-            id_match = re.search(r"\d{3}-\d{7}-\d{7}", card_text)
+            id_match = _ORDER_ID_RE.search(card_text)
             if id_match:
                 order_id = id_match.group(0)
 
@@ -863,110 +1052,32 @@ class AmazonEnrichmentProvider:
         )
 
     def _parse_line_items(
-        self, card, order_total: Decimal
+        self, card: dict, order_total: Decimal
     ) -> list[AmazonLineItem]:
-        """Extract line items from an order card.
+        """Build line items from an extracted order card.
 
         If individual item prices cannot be determined, falls back to a
         single line item with the order total.
         """
         items: list[AmazonLineItem] = []
 
-        # Look for individual item rows within the order card.  Amazon's
-        # 2025 layout uses ``div.item-box`` for each line item.  Each
-        # item-box contains a product image, title
-        # (``.yohtmlc-product-title``), and action buttons.  Individual
-        # item prices are NOT shown on the order history list page, so
-        # we distribute the order total evenly across items.
-        #
-        # IMPORTANT: Do NOT include ``.a-fixed-left-grid-inner`` here --
-        # it is a child of ``.item-box`` and would cause duplicate matches.
-        item_els = card.query_selector_all(
-            ".item-box, "
-            "div.yohtmlc-item, "
-            "[data-component='purchasedItems'] .a-fixed-left-grid, "
-            "[data-testid='order-item']"
-        )
-
-        for item_el in item_els:
-            # Extract item name.  Prefer the specific product-title class
-            # (``.yohtmlc-product-title``) first; fall back
-            # to a product-page link (``/dp/``) to avoid picking up
-            # unrelated ``a-link-normal`` elements (e.g. "Buy it again").
-            #
-            # IMPORTANT: Do NOT use a bare ``.a-link-normal[href*='/dp/']``
-            # selector here.  Each ``.item-box`` contains TWO such links:
-            # one wrapping the product *image* (``tabindex="-1"``, yields
-            # empty ``inner_text()``) and one inside
-            # ``.yohtmlc-product-title`` with the actual name.  Because
-            # ``query_selector`` returns the first DOM-order match across
-            # ALL comma-separated selectors (no priority), the image link
-            # would be returned first, its empty text would cause the item
-            # to be skipped, and the fallback code would then pick up
-            # "View invoice" as the product name.
-            #
-            # Instead we target the title container or the ``/dp/`` link
-            # that lives specifically inside the title div, excluding the
-            # image-wrapper link via ``:not([tabindex='-1'])``.
-            name_el = item_el.query_selector(
-                ".yohtmlc-product-title, "
-                "[data-component='itemTitle'], "
-                ".yohtmlc-item a, "
-                ".yohtmlc-product-title .a-link-normal[href*='/dp/'], "
-                ".a-link-normal[href*='/dp/']:not([tabindex='-1']), "
-                "[data-testid='item-title']"
-            )
-            if name_el is None:
-                continue
-            name = name_el.inner_text().strip()
+        # Individual item prices are NOT shown on the order history list
+        # page, so we distribute the order total evenly across items.
+        for item in card["items"]:
+            name = (item["name"] or "").strip()
             if not name:
                 continue
 
-            # Extract item price.  Note: Amazon's 2025 order history page
-            # does NOT display individual item prices (only the order total
-            # in the header).  These selectors are kept for forward
-            # compatibility in case Amazon adds per-item pricing later.
-            price_el = item_el.query_selector(
-                ".a-color-price, "
-                ".yohtmlc-item-price, "
-                "[data-component='unitPrice'] .a-text-price :not(.a-offscreen), "
-                ".yohtmlc-item .a-color-price, "
-                "[data-testid='item-price']"
-            )
             price = Decimal("0")
-            if price_el:
-                price = _parse_price(price_el.inner_text())
+            if item["price"] is not None:
+                price = _parse_price(item["price"])
 
             items.append(AmazonLineItem(name=name, price=price))
 
         # If no items found or no prices, create a single item.
         if not items:
             # Try to get at least the product name from the card.
-            #
-            # IMPORTANT: Do NOT include ``.a-link-normal[href*='/gp/']``
-            # here.  The order header contains "View invoice" and
-            # "View order details" links matching that pattern, and they
-            # appear BEFORE the ``.yohtmlc-product-title`` elements in
-            # DOM order.  Since ``query_selector`` returns the first
-            # DOM-order match across all comma-separated selectors, it
-            # would pick up "View invoice" as the product name.
-            #
-            # Likewise, bare ``.a-link-normal[href*='/dp/']`` must be
-            # avoided because the product *image* wrapper link (with
-            # ``tabindex="-1"`` and empty ``inner_text()``) precedes
-            # the title link in each item-box.
-            product_el = card.query_selector(
-                ".yohtmlc-product-title, "
-                "[data-component='itemTitle'], "
-                ".yohtmlc-item a, "
-                ".yohtmlc-product-title .a-link-normal[href*='/dp/'], "
-                ".a-link-normal[href*='/dp/']:not([tabindex='-1']), "
-                "[data-testid='item-title']"
-            )
-            product_name = "Amazon order"
-            if product_el:
-                product_name = product_el.inner_text().strip() or "Amazon order"
-
+            product_name = (card["title"] or "").strip() or "Amazon order"
             items = [
                 AmazonLineItem(name=product_name, price=order_total)
             ]
@@ -4,6 +4,8 @@ This module implements Stage 6 of the pipeline:
 
 - :func:`export` filters out transfers, sorts by date/institution/amount,
   and writes the fixed column schema to a monthly CSV file.
+- :func:`iter_csv_columns` streams selected columns back out of such a
+  file (used by ``learn`` and ``push``).
 - :func:`print_summary` prints a human-readable processing summary to stdout,
   including source counts, categorization breakdown, top uncategorized
   merchants, and spending by category.
@@ -13,7 +15,9 @@ from __future__ import annotations
 
 import csv
 from collections import Counter, defaultdict
+from collections.abc import Iterator
 from decimal import Decimal
+from operator import attrgetter, itemgetter
 from pathlib import Path
 
 from expense_tracker.models import PipelineResult, Transaction
@@ -37,6 +41,10 @@ CSV_COLUMNS = [
     "source",
 ]
 
+# Output row order: date, then institution, then amount.  ``attrgetter``
+# builds the sort key in C rather than through a lambda per item.
+OUTPUT_ORDER = attrgetter("date", "institution", "amount")
+
 
 # ---------------------------------------------------------------------------
 # CSV export
@@ -71,7 +79,7 @@ def export(
     exportable = [txn for txn in transactions if not txn.is_transfer]
 
     # Sort: date ascending, then institution ascending, then amount ascending
-    exportable.sort(key=lambda t: (t.date, t.institution, t.amount))
+    exportable.sort(key=OUTPUT_ORDER)
 
     with open(output_path, "w", newline="", encoding="utf-8") as f:
         writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
@@ -99,6 +107,56 @@ def export(
     return output_path
 
 
+def iter_csv_columns(
+    path: Path,
+    columns: tuple[str, ...],
+    required: tuple[str, ...] = ("transaction_id",),
+) -> Iterator[tuple[str, ...]]:
+    """Stream ``(*required, *columns)`` tuples from an exported CSV file.
+
+    Uses ``csv.reader`` with column positions resolved once from the
+    header, so each row becomes one small tuple instead of a
+    ``DictReader`` dict.  Optional *columns* that are absent from the
+    file (e.g. ones added after it was written) read as ``""``; rows too
+    short to hold the first required column are skipped.
+
+    Args:
+        path: Path to the CSV file.
+        columns: Names of optional columns to yield after *required*.
+        required: Names of columns the file must have, yielded first.
+
+    Yields:
+        One tuple per data row.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        KeyError: If the CSV does not contain one of the *required* columns.
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return
+        for name in required:
+            if name not in header:
+                raise KeyError(name)
+
+        # Absent columns point one past the header; short rows are padded
+        # with empty strings up to the highest index read.
+        width = len(header)
+        indices = [header.index(name) for name in required] + [
+            header.index(name) if name in header else width for name in columns
+        ]
+        limit = max(indices) + 1
+        getter = itemgetter(*indices)
+        for row in reader:
+            if len(row) < limit:
+                if len(row) <= indices[0]:
+                    continue  # Blank or truncated row.
+                row += [""] * (limit - len(row))
+            yield getter(row)
+
+
 # ---------------------------------------------------------------------------
 # Summary printer
 # ---------------------------------------------------------------------------
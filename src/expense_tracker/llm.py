@@ -11,10 +11,14 @@ the best category.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
 import subprocess
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Protocol
 
 logger = logging.getLogger(__name__)
@@ -43,6 +47,10 @@ This is a household in Longmont, Colorado (Boulder County area).
 # Max transactions per batch
 BATCH_SIZE = 80
 
+# Max batches in flight at once.  Each batch is an independent, I/O-bound
+# request (subprocess or HTTP), so they are dispatched from a thread pool.
+MAX_CONCURRENT_BATCHES = 4
+
 
 class LLMAdapter(Protocol):
     """Protocol for LLM-based transaction categorization."""
@@ -55,8 +63,8 @@ class LLMAdapter(Protocol):
         ...
 
 
-def _build_prompt(transactions: list[dict], categories: list[dict]) -> str:
-    """Build the categorization prompt."""
+def _format_taxonomy(categories: list[dict]) -> str:
+    """Render the category taxonomy as the prompt's bullet list."""
     taxonomy_lines: list[str] = []
     for cat in categories:
         name = cat["name"]
@@ -65,7 +73,22 @@ def _build_prompt(transactions: list[dict], categories: list[dict]) -> str:
             taxonomy_lines.append(f"- {name}: {', '.join(subs)}")
         else:
             taxonomy_lines.append(f"- {name}")
-    taxonomy_text = "\n".join(taxonomy_lines)
+    return "\n".join(taxonomy_lines)
+
+
+def _build_prompt(
+    transactions: list[dict],
+    categories: list[dict],
+    *,
+    taxonomy_text: str | None = None,
+) -> str:
+    """Build the categorization prompt.
+
+    Adapters that split a request into several batches pass the
+    pre-rendered *taxonomy_text* so it is formatted once, not per batch.
+    """
+    if taxonomy_text is None:
+        taxonomy_text = _format_taxonomy(categories)
 
     txn_lines: list[str] = []
     for txn in transactions:
@@ -114,6 +137,33 @@ def _build_prompt(transactions: list[dict], categories: list[dict]) -> str:
     )
 
 
+def _run_batches(
+    transactions: list[dict],
+    send: Callable[[list[dict]], list[dict]],
+) -> list[dict]:
+    """Split *transactions* into batches and send them concurrently.
+
+    Up to ``MAX_CONCURRENT_BATCHES`` batches are in flight at once, so
+    the wall time of a large request approaches that of its slowest
+    batch rather than the sum of all of them.  Results are concatenated
+    in batch order.
+    """
+    batches = [
+        transactions[i : i + BATCH_SIZE]
+        for i in range(0, len(transactions), BATCH_SIZE)
+    ]
+    if len(batches) == 1:
+        return send(batches[0])
+
+    logger.info(
+        "Categorizing %d transactions in %d batches",
+        len(transactions), len(batches),
+    )
+    workers = min(MAX_CONCURRENT_BATCHES, len(batches))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return [item for results in pool.map(send, batches) for item in results]
+
+
 def _parse_response(text: str, expected_count: int = 0) -> list[dict]:
     """Extract the JSON array from the LLM response."""
     start = text.find("[")
@@ -178,31 +228,20 @@ class ClaudeCodeAdapter:
         if not transactions:
             return []
 
-        all_results: list[dict] = []
-
-        for i in range(0, len(transactions), BATCH_SIZE):
-            batch = transactions[i : i + BATCH_SIZE]
-            batch_num = i // BATCH_SIZE + 1
-            total_batches = (len(transactions) + BATCH_SIZE - 1) // BATCH_SIZE
-
-            if total_batches > 1:
-                logger.info(
-                    "Categorizing batch %d/%d (%d transactions)",
-                    batch_num, total_batches, len(batch),
-                )
-
-            results = self._invoke_claude(batch, categories)
-            all_results.extend(results)
-
-        return all_results
+        taxonomy_text = _format_taxonomy(categories)
+        return _run_batches(
+            transactions,
+            lambda batch: self._invoke_claude(batch, categories, taxonomy_text),
+        )
 
     def _invoke_claude(
         self,
         transactions: list[dict],
         categories: list[dict],
+        taxonomy_text: str | None = None,
     ) -> list[dict]:
         """Call claude CLI as a subprocess."""
-        prompt = _build_prompt(transactions, categories)
+        prompt = _build_prompt(transactions, categories, taxonomy_text=taxonomy_text)
 
         try:
             result = subprocess.run(
@@ -278,16 +317,14 @@ class AnthropicAdapter:
             )
             return []
 
-        all_results: list[dict] = []
-        for i in range(0, len(transactions), BATCH_SIZE):
-            batch = transactions[i : i + BATCH_SIZE]
-            results = self._call_api(batch, categories, api_key, httpx)
-            all_results.extend(results)
-
-        return all_results
+        taxonomy_text = _format_taxonomy(categories)
+        return _run_batches(
+            transactions,
+            lambda batch: self._call_api(batch, categories, api_key, httpx, taxonomy_text),
+        )
 
-    def _call_api(self, transactions, categories, api_key, httpx):
-        prompt = _build_prompt(transactions, categories)
+    def _call_api(self, transactions, categories, api_key, httpx, taxonomy_text=None):
+        prompt = _build_prompt(transactions, categories, taxonomy_text=taxonomy_text)
         try:
             response = httpx.post(
                 "https://api.anthropic.com/v1/messages",
@@ -319,3 +356,143 @@ class NullAdapter:
 
     def categorize_batch(self, transactions, categories):
         return []
+
+
+class CachingAdapter:
+    """Adapter wrapper that remembers LLM answers on disk across runs.
+
+    Suggestions are keyed by the transaction's merchant, description and
+    source -- the fields that decide its category -- so re-processing a
+    month, or a merchant seen in an earlier month, does not query the
+    LLM again.  Only cache misses are forwarded to the wrapped adapter.
+
+    The cache file records a hash of the category taxonomy, the prompt
+    (including the household context) and the wrapped adapter's model;
+    when any of them changes, the old entries are discarded.
+
+    Misses are forwarded in slices of one round of concurrent batches
+    (``BATCH_SIZE * MAX_CONCURRENT_BATCHES``) and the cache is saved after
+    each slice, so a run that fails or is interrupted part way resumes
+    with only the unanswered transactions.
+
+    Args:
+        adapter: The adapter that answers cache misses.
+        cache_path: JSON file holding the cached suggestions.
+    """
+
+    def __init__(self, adapter: LLMAdapter, cache_path: Path) -> None:
+        self.adapter = adapter
+        self.cache_path = Path(cache_path)
+
+    def categorize_batch(
+        self,
+        transactions: list[dict],
+        categories: list[dict],
+    ) -> list[dict]:
+        if not transactions:
+            return []
+
+        context_hash = _context_hash(categories, getattr(self.adapter, "model", ""))
+        entries = self._load(context_hash)
+
+        results: list[dict] = []
+        misses: list[dict] = []
+        for txn in transactions:
+            hit = entries.get(_cache_key(txn))
+            if hit is None:
+                misses.append(txn)
+            else:
+                results.append({"id": txn["id"], "category": hit[0], "subcategory": hit[1]})
+
+        if misses:
+            logger.info(
+                "LLM cache: %d hit(s), %d miss(es)",
+                len(transactions) - len(misses), len(misses),
+            )
+            step = BATCH_SIZE * MAX_CONCURRENT_BATCHES
+            for i in range(0, len(misses), step):
+                chunk = misses[i : i + step]
+                fresh = self.adapter.categorize_batch(chunk, categories)
+                by_id = {s["id"]: s for s in fresh if s.get("id")}
+                for txn in chunk:
+                    suggestion = by_id.get(txn["id"])
+                    if suggestion and suggestion.get("category"):
+                        entries[_cache_key(txn)] = (
+                            suggestion["category"],
+                            suggestion.get("subcategory", ""),
+                        )
+                results.extend(fresh)
+                # Checkpoint: answers so far survive a later failure.  The
+                # cache is only an optimisation, so a failed write must not
+                # cost this run its answers.
+                try:
+                    self._save(context_hash, entries)
+                except OSError as exc:
+                    logger.warning("Could not write LLM cache %s: %s", self.cache_path, exc)
+
+        return results
+
+    def _load(self, context_hash: str) -> dict[tuple[str, str, str], tuple[str, str]]:
+        """Read cached entries, or return none if stale or unreadable."""
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (json.JSONDecodeError, OSError) as exc:
+            logger.warning("Could not read LLM cache %s: %s", self.cache_path, exc)
+            return {}
+
+        if not isinstance(data, dict) or data.get("context") != context_hash:
+            return {}
+        rows = data.get("entries")
+        if not isinstance(rows, list):
+            logger.warning("Ignoring malformed LLM cache %s", self.cache_path)
+            return {}
+
+        entries: dict[tuple[str, str, str], tuple[str, str]] = {}
+        skipped = 0
+        for row in rows:
+            if (
+                not isinstance(row, list)
+                or len(row) != 5
+                or not all(isinstance(value, str) for value in row)
+            ):
+                skipped += 1
+                continue
+            merchant, description, source, category, subcategory = row
+            entries[(merchant, description, source)] = (category, subcategory)
+        if skipped:
+            logger.warning(
+                "Skipped %d malformed entry(ies) in LLM cache %s", skipped, self.cache_path
+            )
+        return entries
+
+    def _save(
+        self,
+        context_hash: str,
+        entries: dict[tuple[str, str, str], tuple[str, str]],
+    ) -> None:
+        """Atomically rewrite the cache file."""
+        payload = {
+            "context": context_hash,
+            "entries": [[*key, *value] for key, value in entries.items()],
+        }
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, self.cache_path)
+
+
+def _cache_key(txn: dict) -> tuple[str, str, str]:
+    """Return the fields of a batch item that determine its category."""
+    return (txn["merchant"], txn["description"], txn.get("source") or "")
+
+
+def _context_hash(categories: list[dict], model: str) -> str:
+    """Fingerprint the taxonomy, prompt and model a cached answer used.
+
+    The prompt is rendered without transactions, so the hash covers its
+    instructions and household context but not any particular batch.
+    """
+    blob = json.dumps([categories, _build_prompt([], categories), model], sort_keys=True)
+    return hashlib.blake2b(blob.encode("utf-8"), digest_size=8).hexdigest()
@@ -46,7 +46,7 @@ def generate_transaction_id(
     return hashlib.sha256(raw.encode()).hexdigest()[:12]
 
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     """A single financial transaction flowing through the pipeline.
 
@@ -122,7 +122,7 @@ class StageResult:
     errors: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MerchantRule:
     """A merchant-to-category mapping rule.
 
@@ -131,6 +131,9 @@ class MerchantRule:
     the longest pattern wins. User rules take precedence over learned
     rules when pattern lengths are equal.
 
+    Rules are immutable (and therefore hashable); use
+    ``dataclasses.replace`` to derive an updated rule.
+
     Attributes:
         pattern: Substring to match against merchant names
             (case-insensitive).
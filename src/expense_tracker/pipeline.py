@@ -339,12 +339,14 @@ def _detect_transfers(
             continue  # Not a credit
         cc_credits.append(txn)
 
-    # Match pairs: checking debit to CC credit by amount and date window
-    matched_cc_ids: set[str] = set()
+    # Match pairs: checking debit to CC credit by amount and date window.
+    # Matched credits are tracked by object identity: the set is local to
+    # this call and the objects are in hand, so an int hash is enough.
+    matched_cc_ids: set[int] = set()
     for debit in checking_debits:
         debit_abs = abs(debit.amount)
         for credit in cc_credits:
-            if credit.transaction_id in matched_cc_ids:
+            if id(credit) in matched_cc_ids:
                 continue
             if abs(credit.amount) != debit_abs:
                 continue
@@ -354,7 +356,7 @@ def _detect_transfers(
             # Match found -- mark both
             debit.is_transfer = True
             credit.is_transfer = True
-            matched_cc_ids.add(credit.transaction_id)
+            matched_cc_ids.add(id(credit))
             break  # Move to next checking debit
 
     return StageResult(transactions=transactions)
@@ -519,12 +521,13 @@ def _categorize(
     LLM fallback (tier 2) is not implemented in this module.  The
     ``categorizer`` module will handle that when available.
     """
-    from expense_tracker.categorizer import match_rules as cat_match_rules
+    from expense_tracker.categorizer import RuleMatcher
 
+    matcher = RuleMatcher(rules)
     for txn in transactions:
         if txn.category != "Uncategorized":
             continue
-        match = cat_match_rules(txn.merchant, rules, description=txn.description)
+        match = matcher.match(txn.merchant, txn.description)
         if match is not None:
             txn.category = match.category
             txn.subcategory = match.subcategory
@@ -563,12 +566,11 @@ def _detect_recurring_stage(
     if not recurring_merchants:
         return StageResult(transactions=transactions)
 
-    # Build a set of merchants that have explicit recurring rules
-    # (so we don't override them)
-    explicit_recurring_merchants: set[str] = set()
-    for rule in rules:
-        if rule.recurring:
-            explicit_recurring_merchants.add(rule.pattern.upper())
+    from expense_tracker.categorizer import RuleMatcher
+
+    # Index the patterns of explicit recurring rules once (so we don't
+    # override them) instead of rescanning them for every transaction.
+    explicit_recurring = RuleMatcher([rule for rule in rules if rule.recurring])
 
     # Apply auto-detection to transactions
     auto_flagged = 0
@@ -578,15 +580,11 @@ def _detect_recurring_stage(
             continue
 
         # Skip if merchant has an explicit recurring rule
-        merchant_upper = txn.merchant.upper()
-        has_explicit_rule = any(
-            pattern in merchant_upper for pattern in explicit_recurring_merchants
-        )
-        if has_explicit_rule:
+        if explicit_recurring.matches_any(txn.merchant):
             continue
 
         # Check if merchant matches any auto-detected recurring pattern
-        if merchant_upper in recurring_merchants:
+        if txn.merchant.upper() in recurring_merchants:
             txn.is_recurring = True
             auto_flagged += 1
 
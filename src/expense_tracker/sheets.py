@@ -9,6 +9,7 @@ When pushing all months (--all), the sheet is cleared and rewritten.
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 from pathlib import Path
 
 from expense_tracker.models import SheetsConfig, Transaction
@@ -92,7 +93,7 @@ def _authenticate(config: SheetsConfig, root: Path):
 
 
 def push_to_sheets(
-    transactions: list[Transaction],
+    transactions: Iterable[Transaction],
     config: SheetsConfig,
     root: Path,
     month: str | None = None,
@@ -107,7 +108,8 @@ def push_to_sheets(
     with all provided transactions.
 
     Args:
-        transactions: Transaction objects to push.
+        transactions: Transaction objects to push, in sheet order.  Any
+            iterable is accepted; it is consumed exactly once.
         config: Sheets config (credentials, spreadsheet ID, worksheet).
         root: Project root for resolving relative credential paths.
         month: If set, only replace this month's data (upsert mode).
@@ -132,20 +134,19 @@ def push_to_sheets(
         return _replace_all(worksheet, transactions)
 
 
-def _replace_all(worksheet, transactions: list[Transaction]) -> int:
+def _replace_all(worksheet, transactions: Iterable[Transaction]) -> int:
     """Clear the sheet and write all transactions."""
     rows = [COLUMNS]  # header
-    for txn in transactions:
-        rows.append(_txn_to_row(txn))
+    rows.extend(map(_txn_to_row, transactions))
 
     worksheet.clear()
     worksheet.update(rows, value_input_option="USER_ENTERED")
-    logger.info("Replaced all data: %d rows", len(transactions))
-    return len(transactions)
+    logger.info("Replaced all data: %d rows", len(rows) - 1)
+    return len(rows) - 1
 
 
 def _upsert_month(
-    worksheet, transactions: list[Transaction], month: str,
+    worksheet, transactions: Iterable[Transaction], month: str,
 ) -> int:
     """Replace only the specified month's rows, preserving everything else.
 
@@ -154,17 +155,19 @@ def _upsert_month(
     3. Append the new transactions for that month.
     4. Sort by date and write back.
     """
+    # Build new rows for the target month; the list is kept for the
+    # full-replace fallback.
+    transactions = list(transactions)
+    new_rows = [_txn_to_row(txn) for txn in transactions]
+
     # Read current sheet data
     existing = worksheet.get_all_values()
 
     if not existing:
         # Empty sheet — write header + data
-        rows = [COLUMNS]
-        for txn in transactions:
-            rows.append(_txn_to_row(txn))
-        worksheet.update(rows, value_input_option="USER_ENTERED")
-        logger.info("Sheet was empty, wrote %d rows for %s", len(transactions), month)
-        return len(transactions)
+        worksheet.update([COLUMNS] + new_rows, value_input_option="USER_ENTERED")
+        logger.info("Sheet was empty, wrote %d rows for %s", len(new_rows), month)
+        return len(new_rows)
 
     header = existing[0]
     data_rows = existing[1:]
@@ -181,9 +184,6 @@ def _upsert_month(
     kept_rows = [row for row in data_rows if row[month_col] != month]
     removed_count = len(data_rows) - len(kept_rows)
 
-    # Build new rows for the target month
-    new_rows = [_txn_to_row(txn) for txn in transactions]
-
     # Combine: kept rows + new rows
     all_data = kept_rows + new_rows
 
@@ -18,8 +18,10 @@ from pathlib import Path
 
 import pytest
 
+from expense_tracker import categorizer
 from expense_tracker.categorizer import (
     LLMAdapter,
+    RuleMatcher,
     categorize,
     learn,
     match_rules,
@@ -138,6 +140,21 @@ SAMPLE_CATEGORIES = [
 # ===================================================================
 
 
+@pytest.fixture(params=["automaton", "regex"])
+def matcher_engine(request, monkeypatch):
+    """Run a test against both RuleMatcher engines.
+
+    ``automaton`` uses the optional pyahocorasick extension (skipped if it
+    is not installed); ``regex`` forces the stdlib alternation fallback.
+    """
+    if request.param == "automaton":
+        pytest.importorskip("ahocorasick")
+    else:
+        monkeypatch.setattr(categorizer, "_load_ahocorasick", lambda: None)
+    return request.param
+
+
+@pytest.mark.usefixtures("matcher_engine")
 class TestMatchRules:
     """Tests for the match_rules function."""
 
@@ -299,6 +316,103 @@ class TestMatchRules:
         assert result2.category == "Food & Dining"
 
 
+@pytest.mark.usefixtures("matcher_engine")
+class TestRuleMatcher:
+    """Tests for the reusable RuleMatcher index."""
+
+    def test_reused_across_merchants(self):
+        """One matcher gives the same answers as match_rules for many merchants."""
+        rules = [
+            MerchantRule(pattern="king", category="Misc", subcategory="", source="user"),
+            MerchantRule(
+                pattern="King Soopers",
+                category="Food & Dining",
+                subcategory="Groceries",
+                source="user",
+            ),
+        ]
+        matcher = RuleMatcher(rules)
+        for merchant in ("KING SOOPERS #0099", "burger king", "SUBWAY"):
+            assert matcher.match(merchant) is match_rules(merchant, rules)
+
+    def test_equal_rule_sets_share_compiled_engine(self):
+        """Matchers over equal rule sets reuse one compiled engine."""
+        rules = [
+            MerchantRule(pattern="KING SOOPERS", category="Food & Dining"),
+            MerchantRule(pattern="NETFLIX", category="Entertainment"),
+        ]
+        first = RuleMatcher(rules)
+        second = RuleMatcher(list(rules))
+        assert first._automaton is second._automaton
+        assert first._regex is second._regex
+
+    def test_repeated_pairs_scanned_once(self, monkeypatch):
+        """Each distinct merchant/description pair is scanned only once."""
+        rules = [MerchantRule(pattern="STARBUCKS", category="Food & Dining")]
+        matcher = RuleMatcher(rules)
+        calls = []
+        original = matcher._longest
+        monkeypatch.setattr(matcher, "_longest", lambda text: calls.append(text) or original(text))
+
+        for _ in range(3):
+            assert matcher.match("STARBUCKS #123") is rules[0]
+            assert matcher.match("SUBWAY") is None
+        assert calls == ["STARBUCKS #123", "SUBWAY"]
+
+    def test_description_fallback(self):
+        """The description is consulted when the merchant has no match."""
+        rules = [
+            MerchantRule(pattern="LEGO", category="Kids", subcategory="Toys"),
+        ]
+        matcher = RuleMatcher(rules)
+        result = matcher.match("AMAZON", description="LEGO Classic Bricks")
+        assert result is not None
+        assert result.subcategory == "Toys"
+
+    def test_matches_any(self):
+        """matches_any reports whether any pattern occurs in the text."""
+        matcher = RuleMatcher(
+            [MerchantRule(pattern="netflix", category="Entertainment")]
+        )
+        assert matcher.matches_any("NETFLIX.COM/BILL")
+        assert not matcher.matches_any("HULU")
+        assert not RuleMatcher([]).matches_any("NETFLIX")
+
+    def test_tie_prefers_earlier_rule_across_distinct_patterns(self):
+        """Equal-length distinct patterns resolve to the earlier rule."""
+        rules = [
+            MerchantRule(pattern="SOOPERS", category="Food & Dining", source="user"),
+            MerchantRule(pattern="KING SO", category="Misc", source="learned"),
+        ]
+        result = RuleMatcher(rules).match("KING SOOPERS")
+        assert result is not None
+        assert result.category == "Food & Dining"
+
+    def test_empty_pattern_matches_everything(self):
+        """An empty pattern is a match of last resort."""
+        rules = [
+            MerchantRule(pattern="", category="Miscellaneous"),
+            MerchantRule(pattern="HULU", category="Entertainment"),
+        ]
+        matcher = RuleMatcher(rules)
+        assert matcher.match("HULU").category == "Entertainment"
+        assert matcher.match("ANYTHING").category == "Miscellaneous"
+        assert matcher.matches_any("ANYTHING")
+
+    def test_overlapping_patterns_at_different_offsets(self):
+        """A longer pattern starting inside a shorter hit is still found."""
+        rules = [
+            MerchantRule(pattern="AB", category="Short", source="user"),
+            MerchantRule(pattern="BCDE", category="Long", source="learned"),
+            MerchantRule(pattern="a.b", category="Literal", source="learned"),
+        ]
+        matcher = RuleMatcher(rules)
+        assert matcher.match("XABCDE").category == "Long"
+        # Regex metacharacters in patterns are matched literally.
+        assert matcher.match("AXB") is None
+        assert matcher.match("A.B").category == "Literal"
+
+
 # ===================================================================
 # categorize tests
 # ===================================================================
@@ -524,6 +638,39 @@ class TestCategorize:
         assert batch[0]["amount"] == "-42.50"
         assert batch[0]["date"] == "2026-01-20"
 
+    def test_identical_transactions_sent_once(self):
+        """Repeat merchant/description pairs are sent once and fanned back out."""
+        mock_llm = MockLLMAdapter(suggestions={"STARBUCKS": ("Food & Dining", "Coffee")})
+        txns = [
+            _make_txn("STARBUCKS", transaction_id=f"sbux_{i}", amount=Decimal(f"-{i + 4}.50"))
+            for i in range(3)
+        ]
+        txns.append(
+            _make_txn("STARBUCKS", description="STARBUCKS RESERVE", transaction_id="sbux_r")
+        )
+
+        result = categorize(txns, [], SAMPLE_CATEGORIES, llm_adapter=mock_llm)
+
+        batch = mock_llm.calls[0][0]
+        assert [item["id"] for item in batch] == ["sbux_0", "sbux_r"]
+        assert all(t.subcategory == "Coffee" for t in result.transactions)
+        assert result.warnings == []
+
+    def test_unreadable_transactions_not_sent(self):
+        """Rows without readable text stay uncategorized and skip the LLM."""
+        mock_llm = MockLLMAdapter(suggestions={"CHIPOTLE": ("Food & Dining", "Fast Food")})
+        txns = [
+            _make_txn("CHIPOTLE"),
+            _make_txn("12345", transaction_id="numeric"),
+            _make_txn("", description="#8", transaction_id="blank"),
+        ]
+
+        result = categorize(txns, [], SAMPLE_CATEGORIES, llm_adapter=mock_llm)
+
+        assert [item["id"] for item in mock_llm.calls[0][0]] == ["test_chipotle"]
+        assert [t.category for t in result.transactions[1:]] == ["Uncategorized"] * 2
+        assert any("2 transaction(s)" in w and "not sent" in w for w in result.warnings)
+
 
 # ===================================================================
 # learn tests
@@ -993,3 +1140,30 @@ class TestLearn:
         assert result.added == 1
         assert result.rules[0].category == "Food & Dining"
         assert result.rules[0].subcategory == "Groceries"
+
+    def test_reordered_and_missing_columns(self, tmp_path):
+        """Columns are located by header name; absent ones read as empty."""
+        original = tmp_path / "original.csv"
+        corrected = tmp_path / "corrected.csv"
+
+        original.write_text("category,merchant,transaction_id\nShopping,REI,tx1\n")
+        corrected.write_text("transaction_id,merchant,category\ntx1,REI,Health & Fitness\n")
+
+        rules: list[MerchantRule] = []
+        result = learn(original, corrected, rules)
+
+        assert result.added == 1
+        assert result.rules[0].pattern == "REI"
+        assert result.rules[0].category == "Health & Fitness"
+        assert result.rules[0].subcategory == ""
+
+    def test_missing_transaction_id_column_raises(self, tmp_path):
+        """A CSV without a transaction_id column raises KeyError."""
+        original = tmp_path / "original.csv"
+        corrected = tmp_path / "corrected.csv"
+
+        original.write_text("merchant,category\nREI,Shopping\n")
+        corrected.write_text("merchant,category\nREI,Shopping\n")
+
+        with pytest.raises(KeyError, match="transaction_id"):
+            learn(original, corrected, [])
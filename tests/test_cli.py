@@ -1,6 +1,7 @@
 """Tests for the Click CLI layer.
 
-Uses Click's CliRunner to invoke commands without spawning subprocesses.
+Uses Click's CliRunner to invoke commands without spawning subprocesses
+(the import-cost check, which needs a fresh interpreter, is the exception).
 Mocks the business logic modules to isolate CLI behavior (argument parsing,
 error handling, output formatting) from pipeline internals.
 """
@@ -9,6 +10,8 @@ from __future__ import annotations
 
 import csv
 import shutil
+import subprocess
+import sys
 from datetime import date
 from decimal import Decimal
 from pathlib import Path
@@ -24,6 +27,7 @@ from expense_tracker.models import (
     LearnResult,
     MerchantRule,
     PipelineResult,
+    SheetsConfig,
     StageResult,
     Transaction,
 )
@@ -173,6 +177,41 @@ class TestCLIHelp:
         assert result.exit_code == 0
         assert "expense-tracker" in result.output
 
+    def test_import_loads_no_business_modules(self) -> None:
+        """Importing the CLI (as ``expense --help`` does) stays lightweight.
+
+        Commands import their dependencies on demand; a fresh interpreter
+        is used so modules imported by other tests do not mask a
+        regression.
+        """
+        heavy = [
+            "expense_tracker.models",
+            "expense_tracker.config",
+            "expense_tracker.pipeline",
+            "expense_tracker.categorizer",
+            "expense_tracker.llm",
+            "expense_tracker.export",
+            "expense_tracker.sheets",
+            "expense_tracker.enrichment",
+            "httpx",
+            "gspread",
+            "playwright",
+            "logging",
+        ]
+        code = (
+            "import sys, expense_tracker.cli\n"
+            f"print(','.join(m for m in {heavy!r} if m in sys.modules))"
+        )
+        src_dir = Path(__file__).resolve().parent.parent / "src"
+        proc = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=src_dir,
+        )
+        assert proc.stdout.strip() == ""
+
 
 # ===========================================================================
 # expense process
@@ -201,6 +240,17 @@ class TestProcessCommand:
         result = runner.invoke(cli, ["process", "--month", "abcd-ef"])
         assert result.exit_code != 0
 
+    @pytest.mark.parametrize("command", ["process", "enrich", "push", "download"])
+    def test_month_rejected_at_parse_time(self, runner: CliRunner, command: str) -> None:
+        """Every --month option reports a bad month as a usage error."""
+        args = [command, "--month", "2026-13"]
+        if command == "enrich":
+            args += ["--source", "amazon"]
+        result = runner.invoke(cli, args)
+        assert result.exit_code == 2
+        assert "Invalid value for '--month'" in result.output
+        assert "Month must be between 01 and 12" in result.output
+
     @patch("expense_tracker.config.load_config")
     def test_missing_config_file(
         self,
@@ -317,6 +367,43 @@ class TestProcessCommand:
         from expense_tracker.llm import NullAdapter
         adapter = call_kwargs.kwargs.get("llm_adapter")
         assert isinstance(adapter, NullAdapter)
+        # The taxonomy is only needed by the LLM, so it is not loaded.
+        mock_load_categories.assert_not_called()
+        assert call_kwargs.kwargs.get("categories") == []
+
+    @patch("expense_tracker.export.print_summary")
+    @patch("expense_tracker.export.export")
+    @patch("expense_tracker.pipeline.run")
+    @patch("expense_tracker.config.load_rules")
+    @patch("expense_tracker.config.load_config")
+    def test_process_no_llm_does_not_report_unsent(
+        self,
+        mock_load_config: MagicMock,
+        mock_load_rules: MagicMock,
+        mock_pipeline_run: MagicMock,
+        mock_export: MagicMock,
+        mock_print_summary: MagicMock,
+        runner: CliRunner,
+    ) -> None:
+        """--no-llm does not warn about transactions held back from the LLM."""
+        mock_load_config.return_value = _make_app_config()
+        mock_load_rules.return_value = _make_rules()
+
+        pipeline_result = _make_pipeline_result()
+        pipeline_result.transactions[1].merchant = "12345"
+        pipeline_result.transactions[1].description = "#8"
+        mock_pipeline_run.return_value = pipeline_result
+        mock_export.return_value = Path("output/2026-01.csv")
+
+        result = runner.invoke(
+            cli,
+            ["process", "--month", "2026-01", "--no-llm"],
+            catch_exceptions=False,
+        )
+
+        assert result.exit_code == 0, result.output
+        summarized = mock_print_summary.call_args.args[0]
+        assert not any("not sent" in w for w in summarized.warnings)
 
     @patch("expense_tracker.export.print_summary")
     @patch("expense_tracker.export.export")
@@ -401,10 +488,11 @@ class TestProcessCommand:
 
         assert result.exit_code == 0, result.output
 
-        from expense_tracker.llm import AnthropicAdapter
+        from expense_tracker.llm import AnthropicAdapter, CachingAdapter
         call_kwargs = mock_categorize.call_args
         adapter = call_kwargs.kwargs.get("llm_adapter")
-        assert isinstance(adapter, AnthropicAdapter)
+        assert isinstance(adapter, CachingAdapter)
+        assert isinstance(adapter.adapter, AnthropicAdapter)
 
     @patch("expense_tracker.export.print_summary")
     @patch("expense_tracker.export.export")
@@ -600,6 +688,8 @@ class TestLearnCommand:
         assert "1" in result.output
 
         mock_learn.assert_called_once()
+        assert mock_learn.call_args.kwargs["original_path"] == original_path
+        assert mock_learn.call_args.kwargs["corrected_path"] == corrected_path
         mock_save.assert_called_once()
 
     @patch("expense_tracker.config.save_learned_rules")
@@ -781,8 +871,11 @@ class TestInitCommand:
         # Config file should not have been overwritten
         assert config_path.read_text() == custom_content
 
-    def test_init_default_dir(self, runner: CliRunner, tmp_path: Path) -> None:
+    def test_init_default_dir(
+        self, runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Init without --dir should use current directory."""
+        monkeypatch.chdir(tmp_path)
         result = runner.invoke(
             cli,
             ["init"],
@@ -790,6 +883,7 @@ class TestInitCommand:
         )
         assert result.exit_code == 0
         assert "Initialized" in result.output
+        assert (tmp_path / "config.toml").is_file()
 
     def test_init_output_includes_path(self, runner: CliRunner, tmp_path: Path) -> None:
         """Init should print the resolved path of the initialized directory."""
@@ -808,6 +902,254 @@ class TestInitCommand:
 # ===========================================================================
 
 
+class TestEnrichCommand:
+    """Tests for ``expense enrich`` source dispatch."""
+
+    @patch("expense_tracker.enrichment.venmo.enrich_venmo")
+    @patch("expense_tracker.pipeline.run")
+    @patch("expense_tracker.config.load_exclude_patterns")
+    @patch("expense_tracker.config.load_rules")
+    @patch("expense_tracker.config.load_categories")
+    @patch("expense_tracker.config.load_config")
+    def test_source_dispatched_case_insensitively(
+        self,
+        mock_load_config: MagicMock,
+        mock_load_categories: MagicMock,
+        mock_load_rules: MagicMock,
+        mock_load_excludes: MagicMock,
+        mock_pipeline_run: MagicMock,
+        mock_enrich_venmo: MagicMock,
+        runner: CliRunner,
+    ) -> None:
+        """--source matches provider names regardless of case."""
+        mock_load_config.return_value = _make_app_config()
+        mock_load_categories.return_value = _make_categories()
+        mock_load_rules.return_value = _make_rules()
+        mock_load_excludes.return_value = []
+        mock_pipeline_run.return_value = _make_pipeline_result(2)
+        mock_enrich_venmo.return_value = {
+            "venmo_transactions": 4,
+            "matched": 1,
+            "cache_written": 1,
+        }
+
+        result = runner.invoke(
+            cli,
+            ["enrich", "--month", "2026-01", "--source", "Venmo"],
+            catch_exceptions=False,
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "== Venmo Enrichment Summary ==" in result.output
+        sent = mock_enrich_venmo.call_args.kwargs["transactions"]
+        assert len(sent) == 2
+        assert isinstance(sent[0]["date"], str)
+        assert isinstance(sent[0]["amount"], str)
+
+    @patch("expense_tracker.enrichment.amazon.AmazonEnrichmentProvider.enrich_multi_account")
+    @patch("expense_tracker.pipeline.run")
+    @patch("expense_tracker.config.load_exclude_patterns")
+    @patch("expense_tracker.config.load_rules")
+    @patch("expense_tracker.config.load_categories")
+    @patch("expense_tracker.config.load_config")
+    def test_amazon_summary(
+        self,
+        mock_load_config: MagicMock,
+        mock_load_categories: MagicMock,
+        mock_load_rules: MagicMock,
+        mock_load_excludes: MagicMock,
+        mock_pipeline_run: MagicMock,
+        mock_enrich: MagicMock,
+        runner: CliRunner,
+    ) -> None:
+        from expense_tracker.enrichment import AccountEnrichmentStats, EnrichmentResult
+
+        mock_load_config.return_value = _make_app_config()
+        mock_load_categories.return_value = _make_categories()
+        mock_load_rules.return_value = _make_rules()
+        mock_load_excludes.return_value = []
+        mock_pipeline_run.return_value = _make_pipeline_result(2)
+        mock_enrich.return_value = EnrichmentResult(
+            orders_found=3,
+            orders_matched=2,
+            orders_unmatched=1,
+            cache_files_written=2,
+            unmatched_details=["Order 111 on 2026-01-03 for $9.99"],
+            errors=["primary: session expired"],
+            account_stats=[
+                AccountEnrichmentStats(label="primary", orders_found=2, orders_matched=2),
+                AccountEnrichmentStats(label="secondary", orders_found=1, orders_matched=0),
+            ],
+        )
+
+        result = runner.invoke(
+            cli,
+            ["enrich", "--month", "2026-01", "--source", "amazon"],
+            catch_exceptions=False,
+        )
+
+        assert result.exit_code == 0, result.output
+        assert (
+            "\n"
+            "== Amazon Enrichment Summary ==\n"
+            '  Account "primary": 2 orders found, 2 matched\n'
+            '  Account "secondary": 1 orders found, 0 matched\n'
+            "  Total: 3 orders, 2 matched, 1 unmatched\n"
+            "  Cache files written:  2\n"
+            "\n"
+            "Unmatched orders (review manually):\n"
+            "  - Order 111 on 2026-01-03 for $9.99\n"
+            "\n"
+        ) in result.output
+        assert "Error: primary: session expired\n" in result.output
+
+
+class TestPushCommand:
+    """Tests for ``expense push``."""
+
+    @patch("expense_tracker.sheets.push_to_sheets")
+    @patch("expense_tracker.config.load_config")
+    def test_unchanged_months_not_pushed_again(
+        self,
+        mock_load_config: MagicMock,
+        mock_push: MagicMock,
+        runner: CliRunner,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        from expense_tracker.export import export
+
+        monkeypatch.chdir(tmp_path)
+        config = _make_app_config()
+        config.sheets = SheetsConfig(credentials_file="creds.json", spreadsheet_id="sheet1")
+        mock_load_config.return_value = config
+        mock_push.return_value = 3
+        output_dir = tmp_path / "output"
+        export(_make_pipeline_result(3).transactions, output_dir, "2026-01")
+
+        first = runner.invoke(cli, ["push"], catch_exceptions=False)
+        assert first.exit_code == 0, first.output
+        assert (output_dir / ".push_manifest.json").exists()
+
+        second = runner.invoke(cli, ["push"], catch_exceptions=False)
+        assert second.exit_code == 0, second.output
+        assert "Sheet is up to date" in second.output
+        assert "--force" in second.output
+        assert mock_push.call_count == 1
+
+        # --all and --force always push; so does a changed month file.
+        runner.invoke(cli, ["push", "--all"], catch_exceptions=False)
+        assert mock_push.call_count == 2
+        runner.invoke(cli, ["push", "--force"], catch_exceptions=False)
+        assert mock_push.call_count == 3
+        export(_make_pipeline_result(2).transactions, output_dir, "2026-01")
+        runner.invoke(cli, ["push"], catch_exceptions=False)
+        assert mock_push.call_count == 4
+
+    @patch("expense_tracker.sheets.push_to_sheets")
+    @patch("expense_tracker.config.load_config")
+    def test_months_merged_in_export_order(
+        self,
+        mock_load_config: MagicMock,
+        mock_push: MagicMock,
+        runner: CliRunner,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        from expense_tracker.export import OUTPUT_ORDER, export
+
+        monkeypatch.chdir(tmp_path)
+        config = _make_app_config()
+        config.sheets = SheetsConfig(credentials_file="creds.json", spreadsheet_id="sheet1")
+        mock_load_config.return_value = config
+        pushed = []
+
+        def fake_push(transactions, **kwargs):
+            pushed.extend(transactions)
+            return len(pushed)
+
+        mock_push.side_effect = fake_push
+        output_dir = tmp_path / "output"
+        january = _make_pipeline_result(3).transactions
+        february = _make_pipeline_result(2).transactions
+        for txn in february:
+            txn.date = txn.date.replace(month=2)
+        export(january, output_dir, "2026-01")
+        export(february, output_dir, "2026-02")
+        # Hand edit: rows out of order within a month file.
+        jan_csv = output_dir / "2026-01.csv"
+        header, *rows = jan_csv.read_text(encoding="utf-8").splitlines()
+        jan_csv.write_text("\n".join([header, *reversed(rows)]) + "\n", encoding="utf-8")
+
+        result = runner.invoke(cli, ["push", "--all"], catch_exceptions=False)
+
+        assert result.exit_code == 0, result.output
+        assert "Successfully pushed 5 transactions" in result.output
+        assert pushed == sorted(january + february, key=OUTPUT_ORDER)
+
+
+class TestReadCsvTransactions:
+    """Unit tests for reading exported month CSVs back for push."""
+
+    def test_round_trips_export(self, tmp_path: Path) -> None:
+        from expense_tracker.cli import _read_csv_transactions
+        from expense_tracker.export import export
+
+        original = Transaction(
+            transaction_id="abc123",
+            date=date(2026, 1, 15),
+            merchant="AMAZON",
+            description="LEGO Classic, \"Bricks\"",
+            amount=Decimal("-42.50"),
+            institution="chase",
+            account="Chase Credit Card",
+            category="Kids",
+            subcategory="Toys",
+            is_return=False,
+            is_recurring=True,
+            split_from="parent1",
+            source="Amazon",
+        )
+        path = export([original], tmp_path, "2026-01")
+
+        assert _read_csv_transactions(path) == [original]
+
+    def test_optional_columns_default_and_missing_required_raises(
+        self, tmp_path: Path
+    ) -> None:
+        from expense_tracker.cli import _read_csv_transactions
+
+        legacy = tmp_path / "2025-12.csv"
+        legacy.write_text(
+            "transaction_id,date,merchant,description,amount,institution,"
+            "account,category,subcategory,is_return,split_from\n"
+            "t1,2025-12-01,REI,REI #12,-10.00,chase,Chase,Shopping,,True,\n",
+            encoding="utf-8",
+        )
+        [txn] = _read_csv_transactions(legacy)
+        assert txn.is_return is True
+        assert txn.is_recurring is False
+        assert txn.source == ""
+
+        broken = tmp_path / "2025-11.csv"
+        broken.write_text("transaction_id,date\nt1,2025-11-01\n", encoding="utf-8")
+        with pytest.raises(KeyError, match="merchant"):
+            _read_csv_transactions(broken)
+
+
+class TestFindMonthCsvs:
+    """Unit tests for locating month CSVs in the output directory."""
+
+    def test_only_plain_month_files(self, tmp_path: Path) -> None:
+        from expense_tracker.cli import _find_month_csvs
+
+        for name in ("2026-02.csv", "2025-12.csv", "2026-01-corrected.csv", "notes.csv"):
+            (tmp_path / name).write_text("", encoding="utf-8")
+        (tmp_path / "2026-03.csv").mkdir()
+
+        assert [p.name for p in _find_month_csvs(tmp_path)] == ["2025-12.csv", "2026-02.csv"]
+
+
 class TestMonthValidation:
     """Unit tests for _validate_month helper."""
 
@@ -831,6 +1173,10 @@ class TestMonthValidation:
             _validate_month("2026/01")
         with pytest.raises(BadParameter):
             _validate_month("january")
+        with pytest.raises(BadParameter):
+            _validate_month("2026-011")
+        with pytest.raises(BadParameter):
+            _validate_month("2026--1")
 
     def test_invalid_month_number(self) -> None:
         from click import BadParameter
@@ -106,6 +106,18 @@ input_dir = "input/test"
         assert len(config.accounts) == 1
         assert config.accounts[0].name == "Test Account"
 
+    def test_account_missing_key_raises(self, tmp_path: Path):
+        """An [[accounts]] entry without a required key raises KeyError."""
+        import pytest
+
+        (tmp_path / "config.toml").write_text(
+            '[[accounts]]\nname = "Chase"\ninstitution = "chase"\nparser = "chase"\n'
+            'input_dir = "input/chase"\n',
+            encoding="utf-8",
+        )
+        with pytest.raises(KeyError, match="account_type"):
+            load_config(tmp_path)
+
     def test_missing_config_raises(self, tmp_path: Path):
         """FileNotFoundError is raised when config.toml does not exist."""
         import pytest
@@ -283,6 +295,45 @@ class TestLoadRules:
         assert rules[0].category == "Entertainment"
         assert rules[0].subcategory == ""
 
+    def test_case_duplicates_kept(self, tmp_path: Path):
+        """Patterns repeated up to case are all loaded, so saving keeps them."""
+        (tmp_path / "rules.toml").write_text(
+            """\
+[user_rules]
+"AMAZON" = "Shopping"
+"Amazon" = "Shopping:Online"
+
+[learned_rules]
+"amazon" = "Shopping"
+"starbucks" = "Food & Dining:Coffee"
+"STARBUCKS" = "Food & Dining:Coffee"
+""",
+            encoding="utf-8",
+        )
+        rules = load_rules(tmp_path)
+
+        assert [(r.pattern, r.source) for r in rules] == [
+            ("AMAZON", "user"),
+            ("Amazon", "user"),
+            ("amazon", "learned"),
+            ("starbucks", "learned"),
+            ("STARBUCKS", "learned"),
+        ]
+
+        save_learned_rules(tmp_path, rules)
+        assert load_rules(tmp_path) == rules
+
+    def test_reload_sees_rewritten_file(self, tmp_path: Path):
+        """Cached parses are invalidated when rules.toml is rewritten."""
+        path = tmp_path / "rules.toml"
+        path.write_text('[user_rules]\n"AAA" = "Shopping"\n', encoding="utf-8")
+        assert load_rules(tmp_path)[0].pattern == "AAA"
+
+        tmp = tmp_path / "rules.toml.new"
+        tmp.write_text('[user_rules]\n"BBB" = "Shopping"\n', encoding="utf-8")
+        tmp.replace(path)
+        assert load_rules(tmp_path)[0].pattern == "BBB"
+
     def test_missing_rules_raises(self, tmp_path: Path):
         """FileNotFoundError is raised when rules.toml does not exist."""
         import pytest
@@ -412,6 +463,41 @@ class TestSaveLearnedRules:
         assert len(rules) == 1
         assert rules[0].pattern == "NEW"
 
+    def test_round_trip_needs_quoting(self, tmp_path: Path):
+        """Patterns and values that need escaping survive a save-then-load cycle."""
+        initialize(tmp_path)
+
+        learned = [
+            MerchantRule(pattern="NETFLIX", category="Entertainment", source="learned"),
+            MerchantRule(pattern='JOE\'S "CAFE"', category="Food & Dining", source="learned"),
+            MerchantRule(pattern="C:\\PATH\tTAB", category="Shopping", source="learned"),
+            MerchantRule(
+                pattern="CAFÉ ÜBER", category="Food & Dining", subcategory="Coffee",
+                source="learned",
+            ),
+            MerchantRule(
+                pattern="SPOTIFY", category="Entertainment", subcategory="Subscriptions",
+                recurring=True, source="learned",
+            ),
+        ]
+        save_learned_rules(tmp_path, learned)
+
+        assert load_rules(tmp_path) == learned
+        assert "\nNETFLIX = \"Entertainment\"\n" in (tmp_path / "rules.toml").read_text(
+            encoding="utf-8"
+        )
+
+    def test_leaves_no_temp_file(self, tmp_path: Path):
+        """The atomic replace leaves only rules.toml behind."""
+        initialize(tmp_path)
+        save_learned_rules(
+            tmp_path,
+            [MerchantRule(pattern="STARBUCKS", category="Food & Dining", source="learned")],
+        )
+
+        assert not (tmp_path / "rules.toml.tmp").exists()
+        assert load_rules(tmp_path)[0].pattern == "STARBUCKS"
+
     def test_round_trip_multiple_rules(self, tmp_path: Path):
         """Multiple learned rules survive a save-then-load cycle."""
         initialize(tmp_path)
@@ -545,6 +631,29 @@ class TestInitialize:
         assert (target / "config.toml").is_file()
         assert (target / "input" / "chase").is_dir()
 
+    def test_file_permissions_follow_umask(self, tmp_path: Path):
+        """Config files get the usual 0o666-minus-umask permissions."""
+        import os
+        import stat
+
+        old_umask = os.umask(0o002)
+        try:
+            initialize(tmp_path)
+        finally:
+            os.umask(old_umask)
+
+        mode = stat.S_IMODE((tmp_path / "config.toml").stat().st_mode)
+        assert mode == 0o664
+
+    def test_file_in_place_of_directory_raises(self, tmp_path: Path):
+        """A regular file where a directory belongs is an error, not skipped."""
+        import pytest
+
+        (tmp_path / "output").write_text("not a directory\n", encoding="utf-8")
+
+        with pytest.raises(FileExistsError):
+            initialize(tmp_path)
+
     def test_partial_existing_structure(self, tmp_path: Path):
         """Initialize fills in missing pieces without touching existing ones."""
         # Pre-create some directories but not all.
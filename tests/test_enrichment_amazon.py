@@ -11,6 +11,8 @@ from __future__ import annotations
 
 import json
 import shutil
+import subprocess
+import sys
 from datetime import date
 from decimal import Decimal
 from pathlib import Path
@@ -197,6 +199,32 @@ class TestMatchOrders:
         matches = match_orders_to_transactions(orders, txns)
         assert len(matches) == 0
 
+    def test_transaction_before_order_across_month_end(self) -> None:
+        """The window extends backwards too, across a month boundary."""
+        orders = [
+            AmazonOrder(
+                order_id="test-order",
+                order_date=date(2025, 12, 2),
+                order_total=Decimal("50.00"),
+            )
+        ]
+        txns = [
+            {
+                "transaction_id": "txn_in",
+                "date": date(2025, 11, 29),
+                "amount": Decimal("-50.00"),
+                "merchant": "AMAZON",
+            },
+            {
+                "transaction_id": "txn_out",
+                "date": date(2025, 11, 28),
+                "amount": Decimal("-50.00"),
+                "merchant": "AMAZON",
+            },
+        ]
+        matches = match_orders_to_transactions(orders, txns)
+        assert [t["transaction_id"] for _, t in matches] == ["txn_in"]
+
     def test_amount_tolerance(self) -> None:
         """Orders within $0.01 of the transaction amount are matched."""
         orders = [
@@ -239,7 +267,7 @@ class TestMatchOrders:
         matches = match_orders_to_transactions(orders, txns)
         assert len(matches) == 0
 
-    def test_ambiguous_match_skipped(self) -> None:
+    def test_ambiguous_match_skipped(self, caplog: pytest.LogCaptureFixture) -> None:
         """When multiple transactions could match one order, it is skipped."""
         orders = [
             AmazonOrder(
@@ -265,6 +293,7 @@ class TestMatchOrders:
         ]
         matches = match_orders_to_transactions(orders, txns)
         assert len(matches) == 0
+        assert "test-order ($50.00 on 2025-11-10): 2 candidate transactions" in caplog.text
 
     def test_each_transaction_matched_once(self) -> None:
         """A transaction can only be matched to one order."""
@@ -659,6 +688,198 @@ class TestPriceParsing:
         assert _parse_price("   ") == Decimal("0")
 
 
+# ===========================================================================
+# Scraping tests
+# ===========================================================================
+
+
+class TestPagination:
+    """Tests for _scrape_all_pages stopping conditions."""
+
+    def test_stops_after_page_older_than_range(self) -> None:
+        """Pages older than the target month are never requested."""
+        from expense_tracker.enrichment.amazon import AmazonEnrichmentProvider
+
+        order = AmazonOrder(
+            order_id="111-1111111-1111111",
+            order_date=date(2025, 11, 5),
+            order_total=Decimal("50.00"),
+            items=[],
+        )
+        provider = AmazonEnrichmentProvider()
+        page = MagicMock()
+
+        with patch.object(
+            provider, "_scrape_page_orders", return_value=([order], True)
+        ):
+            orders = provider._scrape_all_pages(
+                page, date(2025, 11, 1), date(2025, 11, 30),
+            )
+
+        assert orders == [order]
+        page.query_selector.assert_not_called()
+
+    def test_follows_next_page_while_in_range(self) -> None:
+        """Pagination continues until the next link is gone."""
+        from expense_tracker.enrichment.amazon import AmazonEnrichmentProvider
+
+        provider = AmazonEnrichmentProvider()
+        page = MagicMock()
+        page.query_selector.side_effect = [MagicMock(), None]
+
+        with patch.object(
+            provider, "_scrape_page_orders", return_value=([], False)
+        ) as mock_page_orders:
+            provider._scrape_all_pages(page, date(2025, 11, 1), date(2025, 11, 30))
+
+        assert mock_page_orders.call_count == 2
+
+
+def _card(text: str, order_id=None, href=None, items=(), title=None) -> dict:
+    """Build an order card as returned by the page extraction script."""
+    return {
+        "text": text,
+        "orderId": order_id,
+        "href": href,
+        "items": [{"name": name, "price": price} for name, price in items],
+        "title": title,
+    }
+
+
+class TestParseOrderCard:
+    """Tests for parsing extracted order cards."""
+
+    def test_full_card(self) -> None:
+        """Date, total, order ID, and item names come from one card."""
+        from expense_tracker.enrichment.amazon import AmazonEnrichmentProvider
+
+        card = _card(
+            "Order placed\nNovember 5, 2025\nTotal\n$50.00",
+            order_id=" 111-1111111-1111111 ",
+            items=[("Widget", None), ("Gadget", None)],
+        )
+
+        order = AmazonEnrichmentProvider()._parse_order_card(card)
+
+        assert order is not None
+        assert order.order_id == "111-1111111-1111111"
+        assert order.order_date == date(2025, 11, 5)
+        assert order.order_total == Decimal("50.00")
+        assert [(i.name, i.price) for i in order.items] == [
+            ("Widget", Decimal("25.00")),
+            ("Gadget", Decimal("25.00")),
+        ]
+
+    def test_order_id_from_href(self) -> None:
+        """Without an order-ID element, the ID is taken from the details link."""
+        from expense_tracker.enrichment.amazon import AmazonEnrichmentProvider
+
+        card = _card(
+            "Order placed November 5, 2025 Total $9.99",
+            href="/gp/your-account/order-details?orderID=222-2222222-2222222&ref=x",
+        )
+
+        order = AmazonEnrichmentProvider()._parse_order_card(card)
+
+        assert order is not None
+        assert order.order_id == "222-2222222-2222222"
+
+    def test_blank_item_names_fall_back_to_title(self) -> None:
+        """Items without names are skipped; the card title names the order."""
+        from expense_tracker.enrichment.amazon import AmazonEnrichmentProvider
+
+        card = _card(
+            "Order placed November 5, 2025 Total $9.99",
+            items=[("  ", None)],
+            title="Book",
+        )
+
+        order = AmazonEnrichmentProvider()._parse_order_card(card)
+
+        assert order is not None
+        assert [(i.name, i.price) for i in order.items] == [("Book", Decimal("9.99"))]
+
+    def test_missing_date_returns_none(self) -> None:
+        """Cards without a recognisable date are skipped."""
+        from expense_tracker.enrichment.amazon import AmazonEnrichmentProvider
+
+        assert AmazonEnrichmentProvider()._parse_order_card(_card("Total $9.99")) is None
+
+    def test_page_cards_extracted_in_one_call(self) -> None:
+        """A page's cards are fetched with a single evaluate call."""
+        from expense_tracker.enrichment.amazon import AmazonEnrichmentProvider
+
+        page = MagicMock()
+        page.evaluate.return_value = [
+            _card("Order placed November 5, 2025 Total $50.00"),
+            _card("Order placed October 30, 2025 Total $20.00"),
+        ]
+
+        orders, past_range = AmazonEnrichmentProvider()._scrape_page_orders(
+            page, date(2025, 11, 1), date(2025, 11, 30),
+        )
+
+        page.evaluate.assert_called_once()
+        assert [o.order_date for o in orders] == [date(2025, 11, 5)]
+        assert past_range
+
+
+class TestBrowserLaunch:
+    """Tests for how _scrape_orders launches the browser."""
+
+    def _scrape(
+        self, auth_dir: Path, needs_login: list[bool], orders_page_loads: bool = True
+    ) -> MagicMock:
+        from expense_tracker.enrichment.amazon import AmazonEnrichmentProvider
+
+        provider = AmazonEnrichmentProvider()
+        p = MagicMock()
+        page = p.chromium.launch_persistent_context.return_value.pages[0]
+        if not orders_page_loads:
+            page.wait_for_selector.side_effect = TimeoutError("no order cards")
+        with (
+            patch("playwright.sync_api.sync_playwright") as mock_sync,
+            patch.object(provider, "_needs_login", side_effect=needs_login),
+            patch.object(provider, "_wait_for_login"),
+            patch.object(provider, "_scrape_all_pages", return_value=[]),
+        ):
+            mock_sync.return_value.__enter__.return_value = p
+            provider._scrape_orders(date(2025, 11, 1), date(2025, 11, 30), auth_dir)
+        return p.chromium.launch_persistent_context
+
+    def test_new_profile_opens_window(self, tmp_path: Path) -> None:
+        """Without a saved profile the browser is headful from the start."""
+        launch = self._scrape(tmp_path, needs_login=[True, False])
+
+        assert [c.kwargs["headless"] for c in launch.call_args_list] == [False]
+
+    def test_saved_profile_runs_headless(self, tmp_path: Path) -> None:
+        """A signed-in saved profile is scraped without a window."""
+        (tmp_path / "browser-profile" / "Default").mkdir(parents=True)
+
+        launch = self._scrape(tmp_path, needs_login=[False, False])
+
+        assert [c.kwargs["headless"] for c in launch.call_args_list] == [True]
+
+    def test_expired_session_relaunches_headful(self, tmp_path: Path) -> None:
+        """If the saved session needs login, the browser reopens with a window."""
+        (tmp_path / "browser-profile" / "Default").mkdir(parents=True)
+
+        launch = self._scrape(tmp_path, needs_login=[True, True, False])
+
+        assert [c.kwargs["headless"] for c in launch.call_args_list] == [True, False]
+
+    def test_unrecognised_page_relaunches_headful(self, tmp_path: Path) -> None:
+        """A challenge page outside /ap/ also reopens the browser with a window."""
+        (tmp_path / "browser-profile" / "Default").mkdir(parents=True)
+
+        launch = self._scrape(
+            tmp_path, needs_login=[False, False], orders_page_loads=False
+        )
+
+        assert [c.kwargs["headless"] for c in launch.call_args_list] == [True, False]
+
+
 # ===========================================================================
 # Provider registry tests
 # ===========================================================================
@@ -675,6 +896,24 @@ class TestProviderRegistry:
         cls = get_provider("amazon")
         assert cls is AmazonEnrichmentProvider
 
+    def test_amazon_imported_on_first_lookup(self) -> None:
+        """Importing the package does not import the Amazon provider."""
+        code = (
+            "import sys, expense_tracker.enrichment as e\n"
+            "print('expense_tracker.enrichment.amazon' in sys.modules)\n"
+            "e.get_provider('amazon')\n"
+            "print('expense_tracker.enrichment.amazon' in sys.modules)"
+        )
+        src_dir = Path(__file__).resolve().parent.parent / "src"
+        proc = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=src_dir,
+        )
+        assert proc.stdout.split() == ["False", "True"]
+
     def test_unknown_provider_raises(self) -> None:
         """Requesting an unknown provider raises KeyError."""
         from expense_tracker.enrichment import get_provider
@@ -1379,6 +1618,22 @@ class TestMultiAccountCLISummary:
         assert "Total:" not in result.output
 
 
+def _scrape_by_account(results: dict) -> object:
+    """Build a ``_scrape_orders`` side effect keyed on the account's auth dir.
+
+    Accounts are scraped concurrently, so call order does not identify
+    the account.  Values that are exceptions are raised.
+    """
+
+    def scrape(first_day, last_day, auth_dir, cache_dir=None, label="default"):
+        result = results[auth_dir.name.removeprefix("amazon-")]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return scrape
+
+
 class TestMultiAccountEnrichProvider:
     """Tests for the AmazonEnrichmentProvider.enrich_multi_account method."""
 
@@ -1407,6 +1662,94 @@ class TestMultiAccountEnrichProvider:
 
         assert mock_scrape.call_count == 2
 
+    def test_enrich_multi_account_scrapes_accounts_concurrently(
+        self, tmp_path: Path
+    ) -> None:
+        """Each account's scrape runs while the others are still in flight."""
+        import threading
+
+        from expense_tracker.enrichment.amazon import AmazonEnrichmentProvider
+        from expense_tracker.models import AmazonAccountConfig
+
+        # Every scrape blocks until all accounts have started; a
+        # sequential loop would time out here.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def scrape(first_day, last_day, auth_dir, cache_dir=None, label="default"):
+            barrier.wait()
+            return []
+
+        provider = AmazonEnrichmentProvider()
+        accounts = [
+            AmazonAccountConfig(label="primary"),
+            AmazonAccountConfig(label="secondary"),
+        ]
+
+        with patch.object(provider, "_scrape_orders", side_effect=scrape):
+            result = provider.enrich_multi_account(
+                month="2025-11",
+                root=tmp_path,
+                amazon_accounts=accounts,
+                transactions=[],
+            )
+
+        assert result.errors == []
+        assert [s.label for s in result.account_stats] == ["primary", "secondary"]
+
+    def test_enrich_multi_account_logins_one_at_a_time(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Accounts that need a login prompt for it one after another."""
+        import logging
+        import threading
+        import time
+
+        from expense_tracker.enrichment.amazon import AmazonEnrichmentProvider
+        from expense_tracker.models import AmazonAccountConfig
+
+        logged_in = threading.local()
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+
+        def wait_for_login(page):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            logged_in.done = True
+
+        provider = AmazonEnrichmentProvider()
+        accounts = [
+            AmazonAccountConfig(label="primary"),
+            AmazonAccountConfig(label="secondary"),
+        ]
+
+        with (
+            caplog.at_level(logging.INFO, logger="expense_tracker.enrichment.amazon"),
+            patch("playwright.sync_api.sync_playwright"),
+            patch.object(
+                provider,
+                "_needs_login",
+                side_effect=lambda page: not getattr(logged_in, "done", False),
+            ),
+            patch.object(provider, "_wait_for_login", side_effect=wait_for_login),
+            patch.object(provider, "_scrape_all_pages", return_value=[]),
+        ):
+            result = provider.enrich_multi_account(
+                month="2025-11",
+                root=tmp_path,
+                amazon_accounts=accounts,
+                transactions=[],
+            )
+
+        assert result.errors == []
+        assert peak[0] == 1
+        assert "Amazon login required (primary)" in caplog.text
+        assert "Amazon login required (secondary)" in caplog.text
+
     @patch("expense_tracker.enrichment.amazon.AmazonEnrichmentProvider._scrape_orders")
     def test_enrich_multi_account_merges_orders_before_matching(
         self, mock_scrape: MagicMock, tmp_path: Path
@@ -1432,7 +1775,9 @@ class TestMultiAccountEnrichProvider:
             ),
         ]
 
-        mock_scrape.side_effect = [primary_orders, secondary_orders]
+        mock_scrape.side_effect = _scrape_by_account(
+            {"primary": primary_orders, "secondary": secondary_orders}
+        )
 
         txns = [
             {
@@ -1498,7 +1843,9 @@ class TestMultiAccountEnrichProvider:
             ),
         ]
 
-        mock_scrape.side_effect = [primary_orders, secondary_orders]
+        mock_scrape.side_effect = _scrape_by_account(
+            {"primary": primary_orders, "secondary": secondary_orders}
+        )
 
         txns = [
             {
@@ -1560,10 +1907,9 @@ class TestMultiAccountEnrichProvider:
             ),
         ]
 
-        mock_scrape.side_effect = [
-            good_orders,
-            RuntimeError("Browser crashed"),
-        ]
+        mock_scrape.side_effect = _scrape_by_account(
+            {"primary": good_orders, "secondary": RuntimeError("Browser crashed")}
+        )
 
         txns = [
             {
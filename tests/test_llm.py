@@ -6,15 +6,20 @@ All tests use mocked HTTP responses. No real API calls are made.
 from __future__ import annotations
 
 import json
+import logging
+import re
 from unittest.mock import patch
 
 import httpx
 import pytest
 
+from expense_tracker import llm
 from expense_tracker.llm import (
     AnthropicAdapter,
+    CachingAdapter,
     NullAdapter,
     _build_prompt,
+    _format_taxonomy,
     _parse_response,
 )
 
@@ -121,6 +126,13 @@ class TestBuildPrompt:
         assert "## Category Taxonomy" in prompt
         assert "## Transactions" in prompt
 
+    def test_pre_rendered_taxonomy_matches(self):
+        """Passing a pre-rendered taxonomy yields the same prompt."""
+        taxonomy_text = _format_taxonomy(SAMPLE_CATEGORIES)
+        assert _build_prompt(
+            SAMPLE_TRANSACTIONS, SAMPLE_CATEGORIES, taxonomy_text=taxonomy_text
+        ) == _build_prompt(SAMPLE_TRANSACTIONS, SAMPLE_CATEGORIES)
+
 
 # ---------------------------------------------------------------------------
 # _parse_response tests
@@ -320,6 +332,34 @@ class TestAnthropicAdapter:
         assert "REI.COM 800-426-4840" in prompt
         assert "Food & Dining" in prompt
 
+    def test_large_input_sent_as_concurrent_batches(self):
+        """Inputs over BATCH_SIZE are split, and results keep input order."""
+        adapter = self._make_adapter()
+        transactions = [
+            {**SAMPLE_TRANSACTIONS[0], "id": f"t{i:03d}"}
+            for i in range(2 * llm.BATCH_SIZE + 5)
+        ]
+
+        def respond(url, **kwargs):
+            prompt = kwargs["json"]["messages"][0]["content"]
+            ids = re.findall(r"^(t\d{3}) \|", prompt, flags=re.MULTILINE)
+            return httpx.Response(
+                status_code=200,
+                json=_make_anthropic_response(
+                    [{"id": i, "category": "Shopping", "subcategory": ""} for i in ids]
+                ),
+                request=httpx.Request("POST", url),
+            )
+
+        with (
+            patch.dict("os.environ", {"TEST_ANTHROPIC_KEY": "sk-ant-test-key"}),
+            patch("httpx.post", side_effect=respond) as mock_post,
+        ):
+            result = adapter.categorize_batch(transactions, SAMPLE_CATEGORIES)
+
+        assert mock_post.call_count == 3
+        assert [r["id"] for r in result] == [t["id"] for t in transactions]
+
     # -- Empty inputs --
 
     def test_empty_transactions_returns_empty(self):
@@ -574,3 +614,149 @@ class TestAnthropicAdapter:
             adapter.categorize_batch(SAMPLE_TRANSACTIONS, SAMPLE_CATEGORIES)
 
         assert mock_post.call_args.args[0] == "https://api.anthropic.com/v1/messages"
+
+
+# ---------------------------------------------------------------------------
+# CachingAdapter tests
+# ---------------------------------------------------------------------------
+
+
+class _RecordingAdapter:
+    """Answers every transaction with one fixed category and records calls."""
+
+    def __init__(self, category: str = "Shopping") -> None:
+        self.category = category
+        self.calls: list[list[dict]] = []
+
+    def categorize_batch(self, transactions, categories):
+        self.calls.append(transactions)
+        return [
+            {"id": t["id"], "category": self.category, "subcategory": ""}
+            for t in transactions
+        ]
+
+
+class TestCachingAdapter:
+    """Tests for the on-disk LLM suggestion cache."""
+
+    def test_second_run_served_from_cache(self, tmp_path):
+        """Previously answered transactions do not reach the wrapped adapter."""
+        inner = _RecordingAdapter()
+        adapter = CachingAdapter(inner, tmp_path / "llm" / "categories.json")
+
+        adapter.categorize_batch(SAMPLE_TRANSACTIONS, SAMPLE_CATEGORIES)
+        renamed = [{**t, "id": t["id"] + "_next"} for t in SAMPLE_TRANSACTIONS]
+        result = adapter.categorize_batch(renamed, SAMPLE_CATEGORIES)
+
+        assert len(inner.calls) == 1
+        assert {r["id"] for r in result} == {t["id"] for t in renamed}
+        assert all(r["category"] == "Shopping" for r in result)
+
+    def test_only_misses_forwarded(self, tmp_path):
+        """A partially cached request forwards only the unseen transactions."""
+        inner = _RecordingAdapter()
+        adapter = CachingAdapter(inner, tmp_path / "categories.json")
+
+        adapter.categorize_batch(SAMPLE_TRANSACTIONS[:1], SAMPLE_CATEGORIES)
+        adapter.categorize_batch(SAMPLE_TRANSACTIONS, SAMPLE_CATEGORIES)
+
+        assert [t["id"] for t in inner.calls[1]] == ["txn_rei_001"]
+
+    def test_taxonomy_change_invalidates(self, tmp_path):
+        """Cached answers are dropped when the category taxonomy changes."""
+        inner = _RecordingAdapter()
+        adapter = CachingAdapter(inner, tmp_path / "categories.json")
+
+        adapter.categorize_batch(SAMPLE_TRANSACTIONS, SAMPLE_CATEGORIES)
+        changed = SAMPLE_CATEGORIES + [{"name": "Travel", "subcategories": []}]
+        adapter.categorize_batch(SAMPLE_TRANSACTIONS, changed)
+
+        assert len(inner.calls) == 2
+
+    def test_prompt_change_invalidates(self, tmp_path, monkeypatch):
+        """Cached answers are dropped when the prompt text changes."""
+        inner = _RecordingAdapter()
+        adapter = CachingAdapter(inner, tmp_path / "categories.json")
+
+        adapter.categorize_batch(SAMPLE_TRANSACTIONS, SAMPLE_CATEGORIES)
+        monkeypatch.setattr(llm, "HOUSEHOLD_CONTEXT", llm.HOUSEHOLD_CONTEXT + "- New note\n")
+        adapter.categorize_batch(SAMPLE_TRANSACTIONS, SAMPLE_CATEGORIES)
+
+        assert len(inner.calls) == 2
+
+    def test_model_change_invalidates(self, tmp_path):
+        """Answers from one model are not served for another."""
+        cache_path = tmp_path / "categories.json"
+        first = _RecordingAdapter()
+        first.model = "sonnet"
+        CachingAdapter(first, cache_path).categorize_batch(SAMPLE_TRANSACTIONS, SAMPLE_CATEGORIES)
+
+        second = _RecordingAdapter()
+        second.model = "opus"
+        CachingAdapter(second, cache_path).categorize_batch(SAMPLE_TRANSACTIONS, SAMPLE_CATEGORIES)
+
+        assert len(second.calls) == 1
+
+    def test_unwritable_cache_keeps_answers(self, tmp_path, caplog):
+        """A failed cache write is logged and the fresh answers are still returned."""
+        inner = _RecordingAdapter()
+        adapter = CachingAdapter(inner, tmp_path / "categories.json")
+
+        with (
+            caplog.at_level(logging.WARNING, logger="expense_tracker.llm"),
+            patch.object(adapter, "_save", side_effect=PermissionError("read-only")),
+        ):
+            result = adapter.categorize_batch(SAMPLE_TRANSACTIONS, SAMPLE_CATEGORIES)
+
+        assert [r["category"] for r in result] == ["Shopping", "Shopping"]
+        assert "Could not write LLM cache" in caplog.text
+
+    def test_malformed_entries_skipped(self, tmp_path):
+        """Rows of the wrong shape are dropped; valid rows are still served."""
+        cache_path = tmp_path / "categories.json"
+        inner = _RecordingAdapter()
+        CachingAdapter(inner, cache_path).categorize_batch(
+            SAMPLE_TRANSACTIONS[:1], SAMPLE_CATEGORIES
+        )
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+        data["entries"] += [["TRUNCATED", "ROW"], None, ["A", "B", "", "Food", 3]]
+        cache_path.write_text(json.dumps(data), encoding="utf-8")
+
+        CachingAdapter(inner, cache_path).categorize_batch(
+            SAMPLE_TRANSACTIONS, SAMPLE_CATEGORIES
+        )
+
+        assert [t["id"] for t in inner.calls[1]] == ["txn_rei_001"]
+
+    def test_failed_run_resumes_from_checkpoint(self, tmp_path, monkeypatch):
+        """Slices answered before a failure are saved and not re-sent."""
+        monkeypatch.setattr(llm, "BATCH_SIZE", 1)
+        monkeypatch.setattr(llm, "MAX_CONCURRENT_BATCHES", 1)
+        cache_path = tmp_path / "categories.json"
+
+        class _FailsSecondCall(_RecordingAdapter):
+            def categorize_batch(self, transactions, categories):
+                if self.calls:
+                    raise ConnectionError("interrupted")
+                return super().categorize_batch(transactions, categories)
+
+        with pytest.raises(ConnectionError):
+            CachingAdapter(_FailsSecondCall(), cache_path).categorize_batch(
+                SAMPLE_TRANSACTIONS, SAMPLE_CATEGORIES
+            )
+
+        inner = _RecordingAdapter()
+        CachingAdapter(inner, cache_path).categorize_batch(SAMPLE_TRANSACTIONS, SAMPLE_CATEGORIES)
+        assert [[t["id"] for t in call] for call in inner.calls] == [["txn_rei_001"]]
+
+    def test_unreadable_cache_ignored(self, tmp_path):
+        """A corrupt cache file is treated as empty and then rewritten."""
+        cache_path = tmp_path / "categories.json"
+        cache_path.write_text("{not json", encoding="utf-8")
+        inner = _RecordingAdapter()
+        adapter = CachingAdapter(inner, cache_path)
+
+        result = adapter.categorize_batch(SAMPLE_TRANSACTIONS, SAMPLE_CATEGORIES)
+
+        assert len(result) == 2
+        assert json.loads(cache_path.read_text(encoding="utf-8"))["entries"]
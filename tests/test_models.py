@@ -1,8 +1,11 @@
 """Tests for expense_tracker.models — dataclass construction and ID generation."""
 
+import dataclasses
 from datetime import date
 from decimal import Decimal
 
+import pytest
+
 from expense_tracker.models import (
     AccountConfig,
     AppConfig,
@@ -311,6 +314,16 @@ class TestMerchantRule:
         assert rule.subcategory == ""
         assert rule.source == "user"
 
+    def test_frozen_and_hashable(self):
+        """Rules are immutable, hashable, and updated via replace()."""
+        rule = MerchantRule(pattern="NETFLIX", category="Entertainment")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            rule.category = "Shopping"
+        assert len({rule, MerchantRule(pattern="NETFLIX", category="Entertainment")}) == 1
+        updated = dataclasses.replace(rule, subcategory="Subscriptions")
+        assert updated.subcategory == "Subscriptions"
+        assert rule.subcategory == ""
+
 
 # ---------------------------------------------------------------------------
 # AccountConfig dataclass